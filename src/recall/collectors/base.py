@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """A standard container for any collected activity."""
 
@@ -25,6 +25,13 @@ class BaseCollector(ABC):
     def name(self) -> str:
         """Return the collector's name, e.g., 'Firefox'."""
 
+    async def prepare(self) -> None:  # noqa: B027
+        """Get ready to collect, e.g. by asking the user for credentials.
+
+        Unlike collect(), this is not subject to the collector timeout, so it
+        may wait on the user.
+        """
+
     @abstractmethod
     async def collect(self, start_time: datetime, end_time: datetime) -> list[Event]:
         """Gather event data."""
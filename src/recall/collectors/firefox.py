@@ -1,11 +1,99 @@
+import asyncio
 import configparser
+import contextlib
+import json
 import platform
 import sqlite3
+from collections.abc import Mapping
 from datetime import datetime, timezone
 from pathlib import Path
 
 from .base import BaseCollector, Event
 
+FETCH_BATCH_SIZE = 2048
+ANALYSIS_LIMIT = 400
+PROFILE_CACHE_FILENAME = "firefox_profile.json"
+
+HISTORY_QUERY = """
+    SELECT
+        h.visit_date / 1000000.0,
+        p.title,
+        p.url
+    FROM moz_historyvisits AS h
+    JOIN moz_places AS p ON h.place_id = p.id
+    WHERE h.visit_date BETWEEN ? AND ?
+    AND p.title IS NOT NULL AND p.title != '';
+"""
+
+# Keeps only the first visit to each page per UTC hour.
+HOURLY_HISTORY_QUERY = """
+    SELECT
+        MIN(h.visit_date) / 1000000.0,
+        p.title,
+        p.url
+    FROM moz_historyvisits AS h
+    JOIN moz_places AS p ON h.place_id = p.id
+    WHERE h.visit_date BETWEEN ? AND ?
+    AND p.title IS NOT NULL AND p.title != ''
+    GROUP BY p.id, h.visit_date / 3600000000
+    ORDER BY 1;
+"""
+
+READ_ONLY_PRAGMAS = (
+    "PRAGMA query_only = 1",
+    "PRAGMA journal_mode = OFF",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -65536",
+    "PRAGMA mmap_size = 268435456",
+)
+
+
+def _tune_connection(con: sqlite3.Connection) -> None:
+    """Apply pragmas suited for a one-off, read-only scan of a SQLite database."""
+    for pragma in READ_ONLY_PRAGMAS:
+        con.execute(pragma)
+
+
+def _read_ini_sections(profiles_ini: Path) -> Mapping[str, Mapping[str, str]]:
+    """Read the sections of profiles.ini in a single pass over its lines.
+
+    Falls back to ConfigParser for lines the simple scan does not understand.
+    """
+    text = profiles_ini.read_text(encoding="utf-8")
+    sections: dict[str, dict[str, str]] = {}
+    current: dict[str, str] | None = None
+
+    for raw_line in text.splitlines():
+        line = raw_line.strip()
+        if not line or line[0] in "#;":
+            continue
+        if line[0] == "[" and line[-1] == "]":
+            current = sections.setdefault(line[1:-1], {})
+            continue
+
+        key, sep, value = line.partition("=")
+        if not sep or current is None:
+            ini_config = configparser.ConfigParser()
+            ini_config.read_string(text)
+            return ini_config
+        current[key.strip()] = value.strip()
+
+    return sections
+
+
+def _analyze_if_needed(con: sqlite3.Connection) -> None:
+    """Gather query planner statistics for a writable copy that has none.
+
+    Firefox normally keeps sqlite_stat1 up to date itself, so this only runs a
+    bounded ANALYZE when the statistics are missing.
+    """
+    has_stats = con.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'",
+    ).fetchone()
+    if not has_stats:
+        con.execute(f"PRAGMA analysis_limit = {ANALYSIS_LIMIT}")
+        con.execute("ANALYZE")
+
 
 class FirefoxDatabaseNotFoundError(FileNotFoundError):
     """Raised when no valid Firefox places.sqlite database can be found."""
@@ -27,6 +115,12 @@ class FirefoxCollector(BaseCollector):
     def __init__(self, config: dict) -> None:
         """Initialize the Firefox collector with its configuration."""
         super().__init__(config)
+        config_dir = Path(
+            self.config.get("config_dir", "~/.config/recall"),
+        ).expanduser()
+        self.profile_cache_path = config_dir / PROFILE_CACHE_FILENAME
+        self.dedup_hourly = bool(self.config.get("dedup_hourly", False))
+        self._db_path: Path | None = None
 
     def name(self) -> str:
         """Return the name of the collector."""
@@ -50,22 +144,19 @@ class FirefoxCollector(BaseCollector):
 
     def _parse_profiles(self, profiles_ini: Path) -> list[tuple[int, str, Path]]:
         """Parse a profiles.ini file and return candidate profiles."""
-        ini_config = configparser.ConfigParser()
-        ini_config.read(profiles_ini)
-
         results: list[tuple[int, str, Path]] = []
         firefox_base_path = profiles_ini.parent
 
-        for section in ini_config.sections():
-            if not section.startswith("Profile"):
+        for section_name, section in _read_ini_sections(profiles_ini).items():
+            if not section_name.startswith("Profile"):
                 continue
 
-            profile_path_str = ini_config[section].get("Path")
-            profile_name = ini_config[section].get("Name")
+            profile_path_str = section.get("Path")
+            profile_name = section.get("Name")
             if not profile_path_str or not profile_name:
                 continue
 
-            is_relative = ini_config[section].getint("IsRelative", 1) == 1
+            is_relative = int(section.get("IsRelative", "1")) == 1
             profile_path = (
                 firefox_base_path / profile_path_str
                 if is_relative
@@ -77,22 +168,89 @@ class FirefoxCollector(BaseCollector):
         results.sort()
         return results
 
-    def _get_db_path(self) -> Path | None:
+    def _load_cached_db_path(self) -> Path | None:
+        """Return the cached places.sqlite path if profiles.ini is unchanged."""
+        try:
+            cache = json.loads(self.profile_cache_path.read_text(encoding="utf-8"))
+            profiles_ini = Path(cache["profiles_ini"])
+            db_path = Path(cache["db_path"])
+            if profiles_ini.stat().st_mtime_ns != cache["ini_mtime_ns"]:
+                return None
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        return db_path if db_path.exists() else None
+
+    def _store_cached_db_path(self, profiles_ini: Path, db_path: Path) -> None:
+        """Remember the resolved places.sqlite path for subsequent runs."""
+        with contextlib.suppress(OSError):
+            cache = {
+                "profiles_ini": str(profiles_ini),
+                "ini_mtime_ns": profiles_ini.stat().st_mtime_ns,
+                "db_path": str(db_path),
+            }
+            self.profile_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self.profile_cache_path.write_text(json.dumps(cache), encoding="utf-8")
+
+    def _find_db_path(self) -> Path | None:
         """Find the places.sqlite file by parsing profiles.ini."""
         for base_path in self._get_base_paths():
             profiles_ini = base_path / "profiles.ini"
-            if not profiles_ini.exists():
+            try:
+                profiles = self._parse_profiles(profiles_ini)
+            except OSError:
                 continue
 
-            for _, _, path in self._parse_profiles(profiles_ini):
+            for _, _, path in profiles:
                 db_file = path / "places.sqlite"
                 if db_file.exists():
+                    self._store_cached_db_path(profiles_ini, db_file)
                     return db_file
 
         return None
 
-    async def collect(self, start_time: datetime, end_time: datetime) -> list[Event]:
-        """Connect to the DB and fetches history within the time range."""
+    def _get_db_path(self) -> Path | None:
+        """Return the places.sqlite path, reusing earlier lookups when possible."""
+        if not self._db_path:
+            self._db_path = self._load_cached_db_path() or self._find_db_path()
+        return self._db_path
+
+    def _connect(self, db_path: Path) -> sqlite3.Connection:
+        """Open places.sqlite for reading.
+
+        While Firefox is running, the latest history lives in the write-ahead log,
+        which immutable mode ignores. In that case the database is copied into
+        memory with the backup API so that the copy includes the WAL contents.
+        The backup retries a locked database forever, so a probe read without a
+        busy timeout first checks that the lock is available, and the immutable
+        read is used if it is not.
+        """
+        if db_path.with_name(f"{db_path.name}-wal").exists():
+            con = sqlite3.connect(":memory:")
+            try:
+                source = sqlite3.connect(
+                    f"file:{db_path}?mode=ro",
+                    uri=True,
+                    timeout=0,
+                )
+                try:
+                    source.execute("SELECT 1 FROM sqlite_master").fetchone()
+                    source.backup(con)
+                finally:
+                    source.close()
+            except sqlite3.Error:
+                con.close()
+            else:
+                _analyze_if_needed(con)
+                _tune_connection(con)
+                return con
+
+        con = sqlite3.connect(f"file:{db_path}?immutable=1", uri=True)
+        _tune_connection(con)
+        return con
+
+    def _query_history(self, start_time: datetime, end_time: datetime) -> list[Event]:
+        """Connect to the DB and fetch history within the time range."""
         db_path = self._get_db_path()
         if not db_path:
             raise FirefoxDatabaseNotFoundError
@@ -100,38 +258,33 @@ class FirefoxCollector(BaseCollector):
         start_micros = int(start_time.timestamp() * 1_000_000)
         end_micros = int(end_time.timestamp() * 1_000_000)
 
-        query = """
-            SELECT
-                h.visit_date,
-                p.title,
-                p.url
-            FROM moz_historyvisits AS h
-            JOIN moz_places AS p ON h.place_id = p.id
-            WHERE h.visit_date BETWEEN ? AND ?
-            AND p.title IS NOT NULL AND p.title != '';
-        """
+        query = HOURLY_HISTORY_QUERY if self.dedup_hourly else HISTORY_QUERY
 
+        source = self.name()
+        from_timestamp = datetime.fromtimestamp
+        utc = timezone.utc
         events = []
         try:
-            con = sqlite3.connect(f"file:{db_path}?immutable=1", uri=True)
+            con = self._connect(db_path)
             cur = con.cursor()
-            for row in cur.execute(query, (start_micros, end_micros)):
-                visit_date_micro, title, url = row
-                ts = datetime.fromtimestamp(
-                    visit_date_micro / 1_000_000,
-                    tz=timezone.utc,
-                )
-                events.append(
+            cur.execute(query, (start_micros, end_micros))
+            while rows := cur.fetchmany(FETCH_BATCH_SIZE):
+                events += [
                     Event(
-                        timestamp=ts,
-                        source=self.name(),
-                        description=f"{title}",
+                        timestamp=from_timestamp(visit_date, utc),
+                        source=source,
+                        description=title,
                         url=url,
-                    ),
-                )
+                    )
+                    for visit_date, title, url in rows
+                ]
             con.close()
         except sqlite3.Error as e:
             msg = f"Failed to query Firefox history: {e}"
             raise ConnectionError(msg) from e
 
         return events
+
+    async def collect(self, start_time: datetime, end_time: datetime) -> list[Event]:
+        """Fetch history within the time range without blocking the event loop."""
+        return await asyncio.to_thread(self._query_history, start_time, end_time)
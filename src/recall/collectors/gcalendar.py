@@ -1,15 +1,39 @@
-from datetime import datetime
+import asyncio
+from datetime import date, datetime, time, timedelta, timezone
 from pathlib import Path
 
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+from googleapiclient.discovery import Resource, build
 from googleapiclient.errors import HttpError
 
 from .base import BaseCollector, Event
 
 SCOPES = ["https://www.googleapis.com/auth/calendar.readonly"]
+CREDENTIALS_REFRESH_LEEWAY = timedelta(minutes=5)
+EVENTS_PAGE_SIZE = 250
+# Only the event properties used to build activity events are requested.
+EVENT_FIELDS = "items(summary,start,htmlLink),nextPageToken"
+ALL_DAY_EVENT_TIME = time(12)
+
+
+def _parse_start(start: dict) -> datetime:
+    """Return the start time of an event, using midday UTC for all-day events.
+
+    The API may write UTC as a trailing Z, which fromisoformat only accepts from
+    Python 3.11 onwards.
+    """
+    if "dateTime" in start:
+        date_time = start["dateTime"]
+        if date_time.endswith("Z"):
+            date_time = date_time[:-1] + "+00:00"
+        return datetime.fromisoformat(date_time)
+    return datetime.combine(
+        date.fromisoformat(start["date"]),
+        ALL_DAY_EVENT_TIME,
+        tzinfo=timezone.utc,
+    )
 
 
 class GoogleCalendarCredentialsError(FileNotFoundError):
@@ -36,21 +60,41 @@ class GoogleCalendarCollector(BaseCollector):
             "credentials_filename",
             "credentials.json",
         )
+        self._creds: Credentials | None = None
+        self._service: Resource | None = None
+        self._service_creds: Credentials | None = None
 
     def name(self) -> str:
         """Return the name of the collector."""
         return "Calendar"
 
-    def _get_credentials(self) -> Credentials:
-        """Handle the OAuth2 flow to get valid user credentials."""
-        creds = None
-
-        self.token_path.parent.mkdir(parents=True, exist_ok=True)
-        if self.token_path.exists():
-            creds = Credentials.from_authorized_user_file(self.token_path, SCOPES)
+    def _is_usable(self, creds: Credentials) -> bool:
+        """Check that credentials are valid and not about to expire."""
+        if not creds.valid:
+            return False
+        if creds.expiry is None:
+            return True
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return creds.expiry - now > CREDENTIALS_REFRESH_LEEWAY
 
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
+    def _get_credentials(self) -> Credentials:
+        """Handle the OAuth2 flow to get valid user credentials.
+
+        Credentials are kept in memory between calls and refreshed shortly before
+        they expire, so the token file is only read once per collector.
+        """
+        creds = self._creds
+        if creds and self._is_usable(creds):
+            return creds
+
+        if not creds:
+            try:
+                creds = Credentials.from_authorized_user_file(self.token_path, SCOPES)
+            except FileNotFoundError:
+                creds = None
+
+        if not creds or not self._is_usable(creds):
+            if creds and creds.refresh_token:
                 creds.refresh(Request())
             else:
                 flow = InstalledAppFlow.from_client_secrets_file(
@@ -59,49 +103,90 @@ class GoogleCalendarCollector(BaseCollector):
                 )
                 creds = flow.run_local_server(port=0)
 
+            self.token_path.parent.mkdir(parents=True, exist_ok=True)
             with Path.open(self.token_path, "w") as token_file:
                 token_file.write(creds.to_json())
+
+        self._creds = creds
         return creds
 
+    def _get_service(self, creds: Credentials) -> Resource:
+        """Return a Calendar API client, reusing it while the credentials match.
+
+        The client is built from the discovery document bundled with
+        googleapiclient, so building it never needs a network round trip.
+        """
+        if self._service is None or self._service_creds is not creds:
+            self._service = build(
+                "calendar",
+                "v3",
+                credentials=creds,
+                cache_discovery=False,
+                static_discovery=True,
+            )
+            self._service_creds = creds
+        return self._service
+
+    def _fetch_api_events(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+    ) -> list[dict]:
+        """Fetch the raw calendar events in the time range from the API."""
+        creds = self._get_credentials()
+        service = self._get_service(creds)
+
+        events_resource = service.events()
+        request = events_resource.list(
+            calendarId="primary",
+            timeMin=start_time.isoformat(),
+            timeMax=end_time.isoformat(),
+            singleEvents=True,
+            orderBy="startTime",
+            maxResults=EVENTS_PAGE_SIZE,
+            fields=EVENT_FIELDS,
+        )
+
+        items = []
+        while request is not None:
+            response = request.execute()
+            items.extend(response.get("items", []))
+            request = events_resource.list_next(request, response)
+        return items
+
+    async def prepare(self) -> None:
+        """Load the credentials, running the OAuth consent flow if needed.
+
+        The consent flow waits for the user in a browser, so it is run here
+        rather than in collect(), which is cut off by the collector timeout.
+        """
+        try:
+            await asyncio.to_thread(self._get_credentials)
+        except FileNotFoundError as file_error:
+            raise GoogleCalendarCredentialsError from file_error
+
     async def collect(self, start_time: datetime, end_time: datetime) -> list[Event]:
         """Collect Google Calendar events for a specified day."""
         try:
-            creds = self._get_credentials()
-            service = build("calendar", "v3", credentials=creds)
-
-            events_result = (
-                service.events()
-                .list(
-                    calendarId="primary",
-                    timeMin=start_time.isoformat(),
-                    timeMax=end_time.isoformat(),
-                    singleEvents=True,
-                    orderBy="startTime",
-                )
-                .execute()
+            api_events = await asyncio.to_thread(
+                self._fetch_api_events,
+                start_time,
+                end_time,
             )
-            api_events = events_result.get("items", [])
 
             if not api_events:
                 return []
 
-            events = []
-            for event_data in api_events:
-                if "dateTime" in event_data["start"]:
-                    start_str = event_data["start"]["dateTime"]
-                    event_ts = datetime.fromisoformat(start_str)
-                else:
-                    date_str = event_data["start"]["date"]
-                    event_ts = datetime.fromisoformat(f"{date_str}T12:00:00Z")
-
-                events.append(
-                    Event(
-                        timestamp=event_ts,
-                        source=self.name(),
-                        description=f"Meeting: {event_data['summary']}",
-                        url=event_data.get("htmlLink"),
-                    ),
+            source = self.name()
+            events = [
+                Event(
+                    timestamp=_parse_start(event_data["start"]),
+                    source=source,
+                    description=f"Meeting: {event_data['summary']}",
+                    url=event_data.get("htmlLink"),
                 )
+                for event_data in api_events
+            ]
         except HttpError as http_error:
             msg = f"An API error occurred: {http_error}"
             raise ConnectionError(msg) from http_error
@@ -1,11 +1,86 @@
+import asyncio
 from datetime import datetime, timedelta, timezone
 
 import gitlab
 from gitlab.exceptions import GitlabAuthenticationError, GitlabError
 from gitlab.v4.objects import Event as GitLabEvent
+from gitlab.v4.objects import User
+
+from recall.utils.concurrency import gather_limited
 
 from .base import BaseCollector, Event
 
+EVENTS_PAGE_SIZE = 100
+PAGE_FETCH_CONCURRENCY = 5
+GRAPHQL_PAGE_SIZE = 100
+TARGET_URL_PATHS = {
+    "MergeRequest": "merge_requests",
+    "Issue": "issues",
+}
+PROJECT_URLS_QUERY = """
+query($ids: [ID!], $first: Int) {
+  projects(ids: $ids, first: $first) {
+    nodes { id webUrl }
+  }
+}
+"""
+
+
+def _parse_created_at(created_at: str) -> datetime:
+    """Parse a GitLab timestamp, keeping its offset and assuming UTC if it has none.
+
+    GitLab uses a trailing Z for UTC, which fromisoformat only accepts from
+    Python 3.11 onwards.
+    """
+    if created_at.endswith("Z"):
+        created_at = created_at[:-1] + "+00:00"
+    event_ts = datetime.fromisoformat(created_at)
+    if event_ts.tzinfo is None:
+        return event_ts.replace(tzinfo=timezone.utc)
+    return event_ts
+
+
+def _branch_name(push_data: dict) -> str:
+    """Return the branch a push went to, accepting both short and full refs."""
+    return push_data.get("ref", "").removeprefix("refs/heads/")
+
+
+def _format_default(event: GitLabEvent) -> str:
+    """Summarize an event by its action and target type."""
+    return f"{event.action_name} {event.target_type or ''}"
+
+
+def _format_push(event: GitLabEvent) -> str:
+    """Summarize a push by its commit count and branch."""
+    push_data = event.push_data
+    if not push_data:
+        return _format_default(event)
+    commit_count = push_data.get("commit_count", 0)
+    return f"Pushed {commit_count} commit(s) to branch '{_branch_name(push_data)}'"
+
+
+def _format_comment(event: GitLabEvent) -> str:
+    """Summarize a comment, including its body."""
+    target = (event.target_type or "").lower()
+    body = event.note.get("body", "")
+    return f"Commented on {target}:\n\n{body}\n"
+
+
+def _format_target_change(event: GitLabEvent) -> str:
+    """Summarize an issue or merge request being opened, closed or merged."""
+    action = event.action_name.capitalize()
+    target = (event.target_type or "").lower()
+    return f"{action} {target}: {event.target_title}"
+
+
+ACTION_FORMATTERS = {
+    "pushed to": _format_push,
+    "commented on": _format_comment,
+    "opened": _format_target_change,
+    "closed": _format_target_change,
+    "merged": _format_target_change,
+}
+
 
 class GitLabCollector(BaseCollector):
     """Collect activity events from the GitLab API."""
@@ -41,6 +116,72 @@ class GitLabCollector(BaseCollector):
 
         return project_url_cache.get(project_id)
 
+    def _fetch_project_urls(
+        self,
+        project_ids: set[int],
+        gl_client: gitlab.Gitlab,
+    ) -> dict[int, str | None]:
+        """Fetch the web URLs of many projects with batched GraphQL queries.
+
+        The events API has no GraphQL equivalent, but the project URLs needed to
+        link the events can be looked up in one request per hundred projects
+        instead of one REST request per project. Projects missing from the
+        result are left for the REST lookup.
+        """
+        project_urls: dict[int, str | None] = {}
+        ids = sorted(project_ids)
+        graphql_url = f"{gl_client.url}/api/graphql"
+
+        for offset in range(0, len(ids), GRAPHQL_PAGE_SIZE):
+            batch = ids[offset : offset + GRAPHQL_PAGE_SIZE]
+            variables = {
+                "ids": [f"gid://gitlab/Project/{project_id}" for project_id in batch],
+                "first": GRAPHQL_PAGE_SIZE,
+            }
+            try:
+                result = gl_client.http_post(
+                    graphql_url,
+                    post_data={"query": PROJECT_URLS_QUERY, "variables": variables},
+                )
+                nodes = result["data"]["projects"]["nodes"]
+            except (GitlabError, KeyError, TypeError):
+                return project_urls
+
+            for node in nodes:
+                project_id = int(node["id"].rsplit("/", 1)[-1])
+                project_urls[project_id] = node["webUrl"]
+
+        return project_urls
+
+    async def _resolve_project_urls(
+        self,
+        project_ids: set[int],
+        gl_client: gitlab.Gitlab,
+    ) -> dict[int, str | None]:
+        """Look up project URLs in worker threads, falling back to REST per project.
+
+        Projects missing from the GraphQL result are fetched concurrently, a few
+        at a time, so that the per-project round-trips overlap.
+        """
+        project_url_cache = await asyncio.to_thread(
+            self._fetch_project_urls,
+            project_ids,
+            gl_client,
+        )
+        await gather_limited(
+            PAGE_FETCH_CONCURRENCY,
+            *(
+                asyncio.to_thread(
+                    self._get_project_base_url,
+                    project_id,
+                    project_url_cache,
+                    gl_client,
+                )
+                for project_id in project_ids - project_url_cache.keys()
+            ),
+        )
+        return project_url_cache
+
     def _get_event_url(
         self,
         event: GitLabEvent,
@@ -51,7 +192,8 @@ class GitLabCollector(BaseCollector):
 
         Uses a cache to avoid redundant API calls for project URLs.
         """
-        if event.action_name == "commented on":
+        action = event.action_name
+        if action == "commented on":
             note = event.note
             if note and "web_url" in note:
                 return note["web_url"]
@@ -64,19 +206,79 @@ class GitLabCollector(BaseCollector):
         if not base_url:
             return None
 
-        target_type = event.target_type
+        target_path = TARGET_URL_PATHS.get(event.target_type)
         target_iid = event.target_iid
-
-        if target_type == "MergeRequest" and target_iid:
-            return f"{base_url}/-/merge_requests/{target_iid}"
-        if target_type == "Issue" and target_iid:
-            return f"{base_url}/-/issues/{target_iid}"
-        if event.action_name == "pushed to" and event.push_data:
-            branch = event.push_data.get("ref", "").split("/")[-1]
-            return f"{base_url}/-/commits/{branch}"
+        if target_path and target_iid:
+            return f"{base_url}/-/{target_path}/{target_iid}"
+        if action == "pushed to":
+            push_data = event.push_data
+            if push_data:
+                return f"{base_url}/-/commits/{_branch_name(push_data)}"
 
         return base_url
 
+    def _get_user(self, gl_client: gitlab.Gitlab) -> User:
+        """Authenticate and fetch the configured GitLab user."""
+        gl_client.auth()
+        return gl_client.users.get(self.user_id)
+
+    def _list_events_page(
+        self,
+        user: User,
+        date_range: tuple[str, str],
+        page: int,
+    ) -> list[GitLabEvent]:
+        """Fetch a single page of the user's events between two exclusive dates.
+
+        Events are listed newest first.
+        """
+        after, before = date_range
+        return user.events.list(
+            after=after,
+            before=before,
+            sort="desc",
+            page=page,
+            per_page=EVENTS_PAGE_SIZE,
+        )
+
+    async def _list_events(
+        self,
+        user: User,
+        date_range: tuple[str, str],
+        oldest: datetime | None = None,
+    ) -> list[GitLabEvent]:
+        """Fetch every page of the user's events, several pages at a time.
+
+        The first page is fetched alone since it is usually the only one. After
+        that, pages are requested in concurrent batches until a short page
+        shows that the end of the event list has been reached, or until a page
+        reaches back past the oldest timestamp of interest.
+        """
+
+        def is_last_page(page_events: list[GitLabEvent]) -> bool:
+            return len(page_events) < EVENTS_PAGE_SIZE or (
+                oldest is not None
+                and _parse_created_at(page_events[-1].created_at) < oldest
+            )
+
+        events = await asyncio.to_thread(self._list_events_page, user, date_range, 1)
+        if is_last_page(events):
+            return events
+
+        next_page = 2
+        while True:
+            pages = await asyncio.gather(
+                *(
+                    asyncio.to_thread(self._list_events_page, user, date_range, page)
+                    for page in range(next_page, next_page + PAGE_FETCH_CONCURRENCY)
+                ),
+            )
+            for page_events in pages:
+                events.extend(page_events)
+                if is_last_page(page_events):
+                    return events
+            next_page += PAGE_FETCH_CONCURRENCY
+
     async def collect(self, start_time: datetime, end_time: datetime) -> list[Event]:
         """Fetch user events from the GitLab API within the time range."""
         if not self.private_token or not self.user_id:
@@ -86,8 +288,7 @@ class GitLabCollector(BaseCollector):
         gl = gitlab.Gitlab(self.gitlab_url, private_token=self.private_token)
 
         try:
-            gl.auth()
-            user = gl.users.get(self.user_id)
+            user = await asyncio.to_thread(self._get_user, gl)
         except GitlabAuthenticationError as gitlab_auth_err:
             msg = f"GitLab authentication error: {gitlab_auth_err}"
             raise ConnectionError(msg) from gitlab_auth_err
@@ -95,50 +296,38 @@ class GitLabCollector(BaseCollector):
             msg = f"Failed to connect to GitLab: {e}"
             raise ConnectionError(msg) from e
 
-        since = start_time - timedelta(seconds=1)
+        # GitLab's after and before filters are exclusive UTC dates, so the UTC
+        # window is widened by a day on each side and the exact range is
+        # checked below.
+        utc_start = start_time.astimezone(timezone.utc)
+        utc_end = end_time.astimezone(timezone.utc)
+        after = (utc_start - timedelta(days=1)).strftime("%Y-%m-%d")
+        before = (utc_end + timedelta(days=1)).strftime("%Y-%m-%d")
 
-        api_events = user.events.list(all=True, after=since.strftime("%Y-%m-%d"))
-
-        events = []
-        project_url_cache = {}
+        api_events = await self._list_events(user, (after, before), start_time)
 
+        in_range = []
         for event in api_events:
-            event_ts = datetime.fromisoformat(event.created_at).replace(
-                tzinfo=timezone.utc,
-            )
+            event_ts = _parse_created_at(event.created_at)
+            if start_time <= event_ts <= end_time:
+                in_range.append((event_ts, event))
 
-            if event_ts > end_time:
-                continue
-
-            summary = self._format_event_summary(event)
-            url = self._get_event_url(event, project_url_cache, gl)
+        project_url_cache = await self._resolve_project_urls(
+            {event.project_id for _, event in in_range if event.project_id},
+            gl,
+        )
 
-            events.append(
-                Event(
-                    timestamp=event_ts,
-                    source=self.name(),
-                    description=summary,
-                    url=url,
-                ),
+        source = self.name()
+        return [
+            Event(
+                timestamp=event_ts,
+                source=source,
+                description=self._format_event_summary(event),
+                url=self._get_event_url(event, project_url_cache, gl),
             )
-
-        return events
+            for event_ts, event in in_range
+        ]
 
     def _format_event_summary(self, event: GitLabEvent) -> str:
         """Create a human-readable summary from a GitLab event object."""
-        action = event.action_name
-        target = event.target_type or ""
-
-        if action == "pushed to" and event.push_data:
-            commit_count = event.push_data.get("commit_count", 0)
-            branch = event.push_data.get("ref", "").split("/")[-1]
-            return f"Pushed {commit_count} commit(s) to branch '{branch}'"
-
-        if action == "commented on":
-            body = event.note.get("body", "")
-            return f"Commented on {target.lower()}:\n\n{body}\n"
-
-        if action in {"opened", "closed", "merged"}:
-            return f"{action.capitalize()} {target.lower()}: {event.target_title}"
-
-        return f"{action} {target}"
+        return ACTION_FORMATTERS.get(event.action_name, _format_default)(event)
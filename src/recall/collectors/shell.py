@@ -1,16 +1,84 @@
-from datetime import datetime
+import asyncio
+import os
+from collections.abc import Iterator
+from datetime import datetime, timedelta
 from pathlib import Path
+from typing import BinaryIO
 
 from rich.console import Console
 
 from .base import BaseCollector, Event
 
-SMALLEST_VALID_TIMESTAMP_LENGTH = 10
-PARTS_IN_HISTORY_LINE = 2
+OFFSET_LENGTH = len("+HHMM")
+READ_CHUNK_SIZE = 64 * 1024
+# Commands from concurrently open shells can be appended slightly out of order,
+# so the backwards scan only stops once it is this far before the start time.
+MAX_OUT_OF_ORDER = timedelta(minutes=5)
 
 console = Console()
 
 
+def _read_lines_reversed(
+    f: BinaryIO,
+    chunk_size: int = READ_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """Yield the lines of a binary file from the last one to the first."""
+    position = f.seek(0, os.SEEK_END)
+    remainder = b""
+    while position > 0:
+        read_size = min(chunk_size, position)
+        position -= read_size
+        f.seek(position)
+        lines = (f.read(read_size) + remainder).split(b"\n")
+        remainder = lines[0]
+        yield from reversed(lines[1:])
+    yield remainder
+
+
+def _normalize_utc_offset(timestamp_str: str) -> str:
+    """Rewrite a trailing Z or +HHMM UTC offset in the +HH:MM form.
+
+    Before Python 3.11, fromisoformat only accepts offsets with a colon, while
+    the shell hooks write them with date's %z.
+    """
+    if timestamp_str.endswith("Z"):
+        return timestamp_str[:-1] + "+00:00"
+    if len(timestamp_str) > OFFSET_LENGTH and timestamp_str[-OFFSET_LENGTH] in "+-":
+        return f"{timestamp_str[:-2]}:{timestamp_str[-2:]}"
+    return timestamp_str
+
+
+def _parse_timestamp(timestamp_str: str) -> datetime | None:
+    """Parse an ISO 8601 timestamp, interpreting naive values as local time."""
+    try:
+        event_ts = datetime.fromisoformat(timestamp_str)
+    except ValueError:
+        try:
+            event_ts = datetime.fromisoformat(_normalize_utc_offset(timestamp_str))
+        except ValueError:
+            return None
+    if event_ts.tzinfo is None:
+        return event_ts.astimezone()
+    return event_ts
+
+
+def _parse_line(line: bytes) -> tuple[datetime, bytes] | None:
+    """Split a log line into its timestamp and the still-encoded command.
+
+    The command is left as bytes so that callers only decode the commands they
+    keep.
+    """
+    timestamp_bytes, _, command_bytes = line.lstrip().partition(b" ")
+    command_bytes = command_bytes.strip()
+    if not command_bytes:
+        return None
+    # The timestamp is ASCII, and latin-1 decodes any byte.
+    event_ts = _parse_timestamp(timestamp_bytes.decode("latin-1"))
+    if event_ts is None:
+        return None
+    return event_ts, command_bytes
+
+
 class ShellCollector(BaseCollector):
     """Collects shell commands from a custom, timestamped history file."""
 
@@ -25,44 +93,51 @@ class ShellCollector(BaseCollector):
         """Return the name of the collector."""
         return "Shell"
 
-    def _parse_line(self, line: str) -> tuple[datetime, str] | None:
-        """Parse a line from the log file into a timestamp and command."""
-        parts = line.strip().split(" ", 1)
-        if len(parts) != PARTS_IN_HISTORY_LINE:
-            return None
-        timestamp_str, command = parts
-        try:
-            event_ts = datetime.fromisoformat(timestamp_str).astimezone()
-        except ValueError:
-            return None
-        return event_ts, command.strip()
-
-    async def collect(self, start_time: datetime, end_time: datetime) -> list[Event]:
-        """Read the custom log file and parse commands within the time range."""
-        if not self.log_file_path.exists():
-            console.print(f"Shell history log file {self.log_file_path} not found.")
-            return []
+    def _read_events(self, start_time: datetime, end_time: datetime) -> list[Event]:
+        """Read the commands within the time range from the log file.
 
+        The log is appended in chronological order, so it is read backwards from
+        the end and the scan stops once the commands are older than start_time.
+        Only the commands inside the time range are decoded from UTF-8.
+        """
         events = []
+        source = self.name()
+        parse_line = _parse_line
+        scan_until = start_time - MAX_OUT_OF_ORDER
         try:
-            with Path.open(self.log_file_path, encoding="utf-8") as f:
-                for line in f:
-                    result = self._parse_line(line)
-                    if not result:
+            with Path.open(self.log_file_path, "rb") as f:
+                for line in _read_lines_reversed(f):
+                    parsed = parse_line(line)
+                    if parsed is None:
                         continue
 
-                    event_ts, command = result
+                    event_ts, command_bytes = parsed
+                    if event_ts < scan_until:
+                        break
 
                     if start_time <= event_ts <= end_time:
                         events.append(
                             Event(
                                 timestamp=event_ts,
-                                source=self.name(),
-                                description=command,
+                                source=source,
+                                description=command_bytes.decode("utf-8"),
                                 url=None,
                             ),
                         )
         except (OSError, ValueError) as e:
             console.print(f"Warning: Could not read or parse shell history file: {e}")
 
+        events.reverse()
         return events
+
+    async def collect(self, start_time: datetime, end_time: datetime) -> list[Event]:
+        """Read the custom log file and parse commands within the time range.
+
+        The file is read in a worker thread so that it does not block the other
+        collectors.
+        """
+        if not await asyncio.to_thread(self.log_file_path.exists):
+            console.print(f"Shell history log file {self.log_file_path} not found.")
+            return []
+
+        return await asyncio.to_thread(self._read_events, start_time, end_time)
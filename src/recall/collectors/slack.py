@@ -1,12 +1,26 @@
+import asyncio
+import contextlib
+import json
 import re
-from datetime import datetime, timezone
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
 
 from rich.console import Console
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 
+from recall.utils.concurrency import gather_limited
+
 from .base import BaseCollector, Event
 
+# Enterprise Grid user IDs start with W instead of U.
+MENTION_RE = re.compile(r"<@([UW][A-Z0-9]+)(?:\|[^>]*)?>")
+USER_CACHE_TTL_SECONDS = 24 * 60 * 60
+USERS_PAGE_LIMIT = 200
+SEARCH_PAGE_SIZE = 100
+SEARCH_PAGE_CONCURRENCY = 4
+
 console = Console()
 
 
@@ -17,6 +31,9 @@ class SlackCollector(BaseCollector):
         """Initialize the Slack collector with its configuration."""
         super().__init__(config)
         self.user_token = self.config.get("user_token")
+        self.config_dir = Path(
+            self.config.get("config_dir", "~/.config/recall"),
+        ).expanduser()
 
     def name(self) -> str:
         """Return the name of the collector."""
@@ -24,71 +41,231 @@ class SlackCollector(BaseCollector):
 
     def _replace_user_mentions(self, text: str, user_map: dict[str, str]) -> str:
         """Replace Slack user ID mentions with their actual usernames."""
+        if "<@" not in text:
+            return text
 
-        def replace_mention(match: re.Match) -> str:
-            user_id = match.group(1)
-            username = user_map.get(user_id, user_id)
-            return f"@{username}"
-
-        return re.sub(r"<@(U[A-Z0-9]+)(?:\|.*?)?>", replace_mention, text)
+        return MENTION_RE.sub(
+            lambda match: "@" + user_map.get(match.group(1), match.group(1)),
+            text,
+        )
 
-    async def collect(self, start_time: datetime, end_time: datetime) -> list[Event]:
-        """Fetch user messages and replaces user IDs with usernames."""
-        if not self.user_token:
-            msg = "Slack 'user_token' must be set in config.yaml."
-            raise ValueError(msg)
+    def _user_cache_path(self, team_id: str) -> Path:
+        """Return the path of the user map cache for a workspace."""
+        return self.config_dir / f"slack_users_{team_id}.json"
 
-        client = WebClient(token=self.user_token)
+    def _load_cached_user_map(
+        self,
+        cache_path: Path,
+    ) -> tuple[dict[str, str], float] | None:
+        """Load a cached user map and its fetch time unless older than the TTL.
 
+        The age is taken from the fetch time stored in the cache, not from the
+        file's mtime, which every rewrite of the file would reset.
+        """
         try:
-            client.auth_test()
-        except SlackApiError as e:
-            msg = f"Slack authentication failed. Check your token: {e}"
-            raise ConnectionError(msg) from e
+            cache = json.loads(cache_path.read_text(encoding="utf-8"))
+            fetched_at = cache["fetched_at"]
+            if time.time() - fetched_at > USER_CACHE_TTL_SECONDS:
+                return None
+            return cache["users"], fetched_at
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
 
+    def _store_user_map(
+        self,
+        cache_path: Path,
+        user_map: dict[str, str],
+        fetched_at: float,
+    ) -> None:
+        """Write the user map to the cache, ignoring file system errors.
+
+        The map is written to a temporary file first and then moved into place,
+        so that an interrupted run never leaves a truncated cache behind.
+        """
+        with contextlib.suppress(OSError):
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f"{cache_path.name}.tmp")
+            cache = {"fetched_at": fetched_at, "users": user_map}
+            tmp_path.write_text(json.dumps(cache), encoding="utf-8")
+            tmp_path.replace(cache_path)
+
+    def _fetch_user_map(self, client: WebClient) -> dict[str, str]:
+        """Fetch all workspace members, following the pagination cursor."""
         user_map = {}
+        cursor = None
+        while True:
+            result = client.users_list(limit=USERS_PAGE_LIMIT, cursor=cursor)
+            user_map.update(
+                {
+                    user["id"]: user["name"]
+                    for user in result.get("members", [])
+                    if "id" in user and "name" in user
+                },
+            )
+
+            cursor = result.get("response_metadata", {}).get("next_cursor")
+            if not cursor:
+                return user_map
+
+    async def _get_user_map(
+        self,
+        client: WebClient,
+        team_id: str,
+    ) -> tuple[dict[str, str], float] | None:
+        """Return the workspace user map and when the member list was fetched.
+
+        The on-disk cache is used when fresh. Returns None if the member list
+        could not be fetched.
+        """
+        cache_path = self._user_cache_path(team_id)
+        cached = self._load_cached_user_map(cache_path)
+        if cached is not None:
+            return cached
+
+        fetched_at = time.time()
         try:
-            result = client.users_list()
-            for user in result.get("members", []):
-                if "id" in user and "name" in user:
-                    user_map[user["id"]] = user["name"]
+            user_map = await asyncio.to_thread(self._fetch_user_map, client)
         except SlackApiError as e:
             console.print(
                 f"Warning: Could not fetch user list from Slack: {e.response['error']}",
             )
+            return None
 
-        events = []
-        on_date = start_time.strftime("%Y-%m-%d")
-        query = f"from:me on:{on_date}"
+        self._store_user_map(cache_path, user_map, fetched_at)
+        return user_map, fetched_at
 
-        try:
-            search_results = client.search_messages(
-                query=query,
-                sort="timestamp",
-                count=100,
-            )
+    async def _resolve_missing_users(
+        self,
+        client: WebClient,
+        texts: list[str],
+        user_map: dict[str, str],
+    ) -> bool:
+        """Look up mentioned users missing from the map and add them to it.
+
+        Returns whether any user was added.
+        """
+        missing = {
+            user_id
+            for text in texts
+            for user_id in MENTION_RE.findall(text)
+            if user_id not in user_map
+        }
+        added = False
+        for user_id in missing:
+            try:
+                result = await asyncio.to_thread(client.users_info, user=user_id)
+            except SlackApiError:
+                continue
+            name = result.get("user", {}).get("name")
+            if name:
+                user_map[user_id] = name
+                added = True
 
-            for match in search_results.get("messages", {}).get("matches", []):
-                event_ts = datetime.fromtimestamp(float(match["ts"]), tz=timezone.utc)
+        return added
 
-                if not (start_time <= event_ts <= end_time):
-                    continue
+    def _search_page(self, client: WebClient, query: str, page: int) -> dict:
+        """Fetch a single page of message search results."""
+        search_results = client.search_messages(
+            query=query,
+            sort="timestamp",
+            count=SEARCH_PAGE_SIZE,
+            page=page,
+        )
+        return search_results.get("messages", {})
 
-                channel_name = match["channel"]["name"]
-                text = self._replace_user_mentions(match.get("text", ""), user_map)
+    async def _search_messages(self, client: WebClient, query: str) -> list[dict]:
+        """Run a message search and return the matches from every result page.
 
-                events.append(
-                    Event(
-                        timestamp=event_ts,
-                        source=self.name(),
-                        description=f"Message in #{channel_name}:\n\n{text}\n",
-                        url=match.get("permalink"),
-                    ),
-                )
+        The first page tells how many pages there are. The rest are then fetched
+        concurrently, a few at a time to stay within Slack's rate limits.
+        """
+        messages = await asyncio.to_thread(self._search_page, client, query, 1)
+        matches = list(messages.get("matches", []))
+        page_count = messages.get("paging", {}).get("pages", 1)
+        if page_count <= 1:
+            return matches
 
+        pages = await gather_limited(
+            SEARCH_PAGE_CONCURRENCY,
+            *(
+                asyncio.to_thread(self._search_page, client, query, page)
+                for page in range(2, page_count + 1)
+            ),
+        )
+        for page_messages in pages:
+            matches.extend(page_messages.get("matches", []))
+        return matches
+
+    async def _find_messages(self, client: WebClient, query: str) -> list[dict]:
+        """Search for messages in a worker thread, warning instead of failing."""
+        try:
+            return await self._search_messages(client, query)
         except SlackApiError as e:
             console.print(
                 f"Warning: Could not perform Slack search: {e.response['error']}",
             )
+            return []
+
+    async def collect(self, start_time: datetime, end_time: datetime) -> list[Event]:
+        """Fetch user messages and replaces user IDs with usernames."""
+        if not self.user_token:
+            msg = "Slack 'user_token' must be set in config.yaml."
+            raise ValueError(msg)
+
+        client = WebClient(token=self.user_token)
+
+        try:
+            auth_result = await asyncio.to_thread(client.auth_test)
+        except SlackApiError as e:
+            msg = f"Slack authentication failed. Check your token: {e}"
+            raise ConnectionError(msg) from e
+
+        team_id = auth_result.get("team_id", "")
+
+        # Slack's after: and before: operators are exclusive and use the
+        # workspace's time zone, so search a day wider and filter exactly below.
+        after_date = (start_time - timedelta(days=1)).strftime("%Y-%m-%d")
+        before_date = (end_time + timedelta(days=1)).strftime("%Y-%m-%d")
+        query = f"from:me after:{after_date} before:{before_date}"
+
+        user_lookup, matches = await asyncio.gather(
+            self._get_user_map(client, team_id),
+            self._find_messages(client, query),
+        )
+        user_map, fetched_at = user_lookup if user_lookup is not None else ({}, None)
+        added = await self._resolve_missing_users(
+            client,
+            [match.get("text", "") for match in matches],
+            user_map,
+        )
+        # Without the full member list, the individually looked up users would
+        # form an incomplete map, so it is not cached. An updated map keeps the
+        # member list's fetch time, so that it still expires on schedule.
+        if added and fetched_at is not None:
+            self._store_user_map(self._user_cache_path(team_id), user_map, fetched_at)
+
+        events = []
+        source = self.name()
+        from_timestamp = datetime.fromtimestamp
+        utc = timezone.utc
+        start_seconds = start_time.timestamp()
+        end_seconds = end_time.timestamp()
+        for match in matches:
+            ts = float(match["ts"])
+            if not (start_seconds <= ts <= end_seconds):
+                continue
+
+            event_ts = from_timestamp(ts, utc)
+            channel_name = match["channel"]["name"]
+            text = self._replace_user_mentions(match.get("text", ""), user_map)
+
+            events.append(
+                Event(
+                    timestamp=event_ts,
+                    source=source,
+                    description=f"Message in #{channel_name}:\n\n{text}\n",
+                    url=match.get("permalink"),
+                ),
+            )
 
         return events
@@ -3,6 +3,11 @@ from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader
+
 DEFAULT_CONFIG_PATH = Path("~/.config/recall/config.yaml").expanduser()
 
 
@@ -26,8 +31,7 @@ def load_config(config_path: Path | None = None) -> dict[str, Any]:
         raise ConfigNotFoundError(config_path)
 
     try:
-        with config_path.open("r") as f:
-            return yaml.safe_load(f)
+        return yaml.load(config_path.read_bytes(), Loader=SafeLoader)
     except (OSError, yaml.YAMLError) as e:
         msg = f"Error loading or parsing config file at {config_path}: {e}"
         raise ConfigError(msg) from e
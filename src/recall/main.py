@@ -2,7 +2,8 @@ import argparse
 import asyncio
 import contextlib
 import sys
-from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from datetime import date, datetime, time, timedelta, tzinfo
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
@@ -19,8 +20,31 @@ from .collectors.gitlab import GitLabCollector
 from .collectors.shell import ShellCollector
 from .collectors.slack import SlackCollector
 from .config import ConfigError, ConfigNotFoundError, load_config
+from .utils.concurrency import DaemonThreadExecutor
 from .utils.summarizer import summarize_events
 
+COLLECTOR_TIMEOUT_SECONDS = 120
+
+# The local time zone is looked up once per run rather than once per event.
+_LOCAL_TZ = datetime.now().astimezone().tzinfo
+
+WEEKDAYS = {
+    "monday": 0,
+    "mon": 0,
+    "tuesday": 1,
+    "tue": 1,
+    "wednesday": 2,
+    "wed": 2,
+    "thursday": 3,
+    "thu": 3,
+    "friday": 4,
+    "fri": 4,
+    "saturday": 5,
+    "sat": 5,
+    "sunday": 6,
+    "sun": 6,
+}
+
 console = Console()
 
 
@@ -29,33 +53,16 @@ def parse_flexible_date(date_str: str) -> date:
 
     Supports keywords like "today", "yesterday", or a weekday (e.g., "friday" or "fri").
     """
-    date_str = date_str.strip().lower()
-    local_today = datetime.now().astimezone().date()
+    date_str = date_str.strip().casefold()
+    local_today = datetime.now(_LOCAL_TZ).date()
 
     if date_str == "today":
         return local_today
     if date_str == "yesterday":
         return local_today - timedelta(days=1)
 
-    day_map = {
-        "monday": 0,
-        "mon": 0,
-        "tuesday": 1,
-        "tue": 1,
-        "wednesday": 2,
-        "wed": 2,
-        "thursday": 3,
-        "thu": 3,
-        "friday": 4,
-        "fri": 4,
-        "saturday": 5,
-        "sat": 5,
-        "sunday": 6,
-        "sun": 6,
-    }
-
-    if date_str in day_map:
-        target_weekday = day_map[date_str]
+    if date_str in WEEKDAYS:
+        target_weekday = WEEKDAYS[date_str]
         today_weekday = local_today.weekday()
 
         days_ago = (today_weekday - target_weekday + 7) % 7
@@ -109,7 +116,7 @@ def parse_arguments() -> tuple[datetime, datetime, Path | None]:
         "date",
         nargs="?",
         help="The date to collect data for in YYYY-MM-DD format. Defaults to today.",
-        default=(datetime.now(timezone.utc)).strftime("%Y-%m-%d"),
+        default="today",
     )
     parser.add_argument(
         "-c",
@@ -133,7 +140,6 @@ def parse_arguments() -> tuple[datetime, datetime, Path | None]:
     args = parser.parse_args()
 
     try:
-        local_tz = datetime.now().astimezone().tzinfo
         target_date = parse_flexible_date(args.date)
         start_time = parse_flexible_time(args.start_time)
         end_time = parse_flexible_time(args.end_time)
@@ -141,22 +147,8 @@ def parse_arguments() -> tuple[datetime, datetime, Path | None]:
         msg = "Invalid date/time format. Please use YYYY-MM-DD and HH:MM:SS formats."
         raise ValueError(msg) from e
     else:
-        base_datetime = datetime(
-            year=target_date.year,
-            month=target_date.month,
-            day=target_date.day,
-            tzinfo=local_tz,
-        )
-        start_datetime = base_datetime.replace(
-            hour=start_time.hour,
-            minute=start_time.minute,
-            second=start_time.second,
-        )
-        end_datetime = base_datetime.replace(
-            hour=end_time.hour,
-            minute=end_time.minute,
-            second=end_time.second,
-        )
+        start_datetime = datetime.combine(target_date, start_time, tzinfo=_LOCAL_TZ)
+        end_datetime = datetime.combine(target_date, end_time, tzinfo=_LOCAL_TZ)
         return start_datetime, end_datetime, args.config
 
 
@@ -192,12 +184,23 @@ def is_interactive() -> bool:
     return sys.stdout.isatty()
 
 
-def print_formatted_event(event: Event, date_str: str, local_tz: tzinfo | None) -> None:
-    """Print a formatted event, with special handling for Slack and GitLab."""
-    if local_tz:
-        local_timestamp = event.timestamp.astimezone(local_tz)
-    else:
-        local_timestamp = event.timestamp.astimezone()
+def print_formatted_event(
+    event: Event,
+    date_str: str,
+    local_tz: tzinfo | None,
+    *,
+    interactive: bool | None = None,
+) -> None:
+    """Print a formatted event, with special handling for Slack and GitLab.
+
+    When the output is not a terminal, the event is written as plain text
+    without going through Rich's markup and layout engine.
+    """
+    if interactive is None:
+        interactive = is_interactive()
+
+    local_timestamp = event.timestamp.astimezone(local_tz or _LOCAL_TZ)
+    time_str = local_timestamp.time().isoformat(timespec="seconds")
     source = f"[{event.source}]"
     duration_str = (
         f"({event.duration_minutes} min)"
@@ -206,27 +209,40 @@ def print_formatted_event(event: Event, date_str: str, local_tz: tzinfo | None)
     )
     description_short = event.description or ""
 
-    has_user_content_and_interactive = (
+    if not interactive:
+        text_to_print = (
+            f"[{date_str} {time_str}] "
+            f"{source} "
+            f"{description_short.strip()} "
+            f"{duration_str} "
+        ).strip()
+        url_line = f"↳ {event.url}\n" if event.url else ""
+        sys.stdout.write(f"{text_to_print}\n{url_line}\n")
+        return
+
+    has_user_content = (
         "Message in" in description_short or "Commented on" in description_short
-    ) and is_interactive()
-
-    if has_user_content_and_interactive:
-        try:
-            header, content = description_short.split("\n\n", 1)
-            time_str = local_timestamp.strftime("%H:%M:%S")
-            console.print(
-                rf"\[{date_str} {time_str}] {source} {header.strip()}",
-            )
+    )
 
-            text_to_render = Text(content.strip(), justify="left")
-            panel = Panel(text_to_render, border_style="cyan", expand=False)
-            console.print(panel)
-        except ValueError:
-            has_user_content_and_interactive = False
+    if has_user_content:
+        # Without a body there is nothing to put in a panel, so such events
+        # fall back to the plain one-line format.
+        header, _, content = description_short.partition("\n\n")
+        content = content.strip()
+        has_user_content = bool(content)
 
-    if not has_user_content_and_interactive:
+    if has_user_content:
+        console.print(
+            rf"\[{date_str} {time_str}] {source} {header.strip()}",
+        )
+
+        text_to_render = Text(content, justify="left")
+        panel = Panel(text_to_render, border_style="cyan", expand=False)
+        console.print(panel)
+
+    if not has_user_content:
         text_to_print = (
-            rf"\[{date_str} {local_timestamp.strftime('%H:%M:%S')}] "
+            rf"\[{date_str} {time_str}] "
             f"{source} "
             f"{description_short.strip()} "
             f"{duration_str} "
@@ -234,10 +250,35 @@ def print_formatted_event(event: Event, date_str: str, local_tz: tzinfo | None)
 
         console.print(text_to_print.strip())
 
+    # URLs are plain text, so they skip markup parsing and share one call with
+    # the blank line that separates events.
     if event.url:
-        console.print(f"↳ {event.url}")
+        console.print(f"↳ {event.url}", markup=False, end="\n\n")
+    else:
+        console.print()
+
+
+async def _run_collector(
+    collector: BaseCollector,
+    start_time: datetime,
+    end_time: datetime,
+) -> tuple[BaseCollector, list[Event] | Exception]:
+    """Run a single collector, returning its events or the error it raised.
 
-    console.print()
+    Only collect() is subject to the timeout, as prepare() may wait on the user.
+    """
+    try:
+        await collector.prepare()
+        events = await asyncio.wait_for(
+            collector.collect(start_time, end_time),
+            timeout=COLLECTOR_TIMEOUT_SECONDS,
+        )
+    except asyncio.TimeoutError:
+        msg = f"timed out after {COLLECTOR_TIMEOUT_SECONDS} seconds"
+        return collector, TimeoutError(msg)
+    except Exception as e:  # noqa: BLE001
+        return collector, e
+    return collector, events
 
 
 async def collect_events(
@@ -246,15 +287,21 @@ async def collect_events(
     end_time: datetime,
     spinner: Yaspin | None = None,
 ) -> list[Event]:
-    """Gather events from all collectors."""
-    tasks = [collector.collect(start_time, end_time) for collector in collectors]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    """Gather events from all collectors.
+
+    Each collector is reported as soon as it finishes, so a slow collector
+    does not hold back the status of the others.
+    """
+    tasks = [
+        _run_collector(collector, start_time, end_time) for collector in collectors
+    ]
 
     all_events = []
-    for i, result in enumerate(results):
-        collector_name = collectors[i].name()
+    for task in asyncio.as_completed(tasks):
+        collector, result = await task
+        collector_name = collector.name()
         message = ""
-        if isinstance(result, (Exception, BaseException)):
+        if isinstance(result, Exception):
             message = f"    - ❌ Error in {collector_name} collector: {result}"
         else:
             message = f"    - ✅ {collector_name} collector found {len(result)} events."
@@ -292,7 +339,8 @@ async def main() -> None:
 
     target_date = start_time
 
-    if is_interactive():
+    interactive = is_interactive()
+    if interactive:
         with yaspin(
             text=f"🚀 Collecting activity for {target_date.strftime('%Y-%m-%d')}...",
             color="yellow",
@@ -308,7 +356,9 @@ async def main() -> None:
         console.print("\nNo activity found for the specified date.")
         return
 
-    all_events.sort(key=lambda x: x.timestamp)
+    # Each collector returns its events mostly in order, and Timsort merges
+    # those runs without a full re-sort.
+    all_events.sort(key=attrgetter("timestamp"))
     summarized = summarize_events(all_events)
 
     day_map = {0: "ma", 1: "ti", 2: "ke", 3: "to", 4: "pe", 5: "la", 6: "su"}
@@ -320,13 +370,26 @@ async def main() -> None:
         f"\n--- Summarized Activity Timeline for {target_date_str} ---\n",
     )
     local_tz = target_date.tzinfo
-    for event in summarized:
-        print_formatted_event(event, date_str, local_tz)
+    # Rich buffers everything printed inside the block and writes it out once
+    # at the end instead of once per print call.
+    with console:
+        for event in summarized:
+            print_formatted_event(event, date_str, local_tz, interactive=interactive)
+
+
+async def _run_main() -> None:
+    """Run main() with blocking calls made on daemon threads.
+
+    A collector that times out while stuck in asyncio.to_thread is then
+    abandoned instead of keeping the process from exiting.
+    """
+    asyncio.get_running_loop().set_default_executor(DaemonThreadExecutor())
+    await main()
 
 
 def _main() -> None:
     with contextlib.suppress(KeyboardInterrupt):
-        asyncio.run(main())  # pragma: no cover
+        asyncio.run(_run_main())  # pragma: no cover
 
 
 if __name__ == "__main__":
@@ -0,0 +1,54 @@
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+async def gather_limited(limit: int, *aws: Awaitable[T]) -> list[T]:
+    """Await all awaitables concurrently, running at most `limit` at a time.
+
+    Results are returned in the order of the awaitables, like asyncio.gather.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+
+    return list(await asyncio.gather(*(run(aw) for aw in aws)))
+
+
+class DaemonThreadExecutor(ThreadPoolExecutor):
+    """Run each submitted call on its own daemon thread.
+
+    ThreadPoolExecutor workers are joined when the interpreter exits, so a call
+    that never returns keeps the process alive. Daemon threads are not joined,
+    which lets a timed-out blocking call be abandoned. It subclasses
+    ThreadPoolExecutor only because asyncio requires one as a default executor.
+    """
+
+    def submit(
+        self,
+        fn: Callable[..., T],
+        /,
+        *args: Any,  # noqa: ANN401
+        **kwargs: Any,  # noqa: ANN401
+    ) -> Future[T]:
+        """Start a daemon thread running the call and return its future."""
+        future: Future[T] = Future()
+
+        def run() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:  # noqa: BLE001
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+        threading.Thread(target=run, daemon=True).start()
+        return future
@@ -1,22 +1,84 @@
+import asyncio
+import os
 import platform
 import sqlite3
+import threading
 from collections.abc import Callable
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from recall.collectors.base import Event
 from recall.collectors.firefox import (
     FirefoxCollector,
     FirefoxDatabaseNotFoundError,
+    _analyze_if_needed,
+    _tune_connection,
 )
 from tests.utils import make_dt
 
+PLACES_SCHEMA = """
+    CREATE TABLE moz_places (id INTEGER PRIMARY KEY, url TEXT, title TEXT);
+    CREATE TABLE moz_historyvisits (
+        id INTEGER PRIMARY KEY,
+        place_id INTEGER,
+        visit_date INTEGER
+    );
+    CREATE INDEX moz_historyvisits_dateindex ON moz_historyvisits (visit_date);
+"""
+
+
+def create_places_db(
+    db_path: Path,
+    visits: list[tuple[int, str, str]],
+    *,
+    wal: bool = False,
+) -> sqlite3.Connection:
+    """Create a minimal places.sqlite with the given (minute, title, url) visits.
+
+    The connection is returned open so that WAL contents are not checkpointed.
+    """
+    con = sqlite3.connect(db_path)
+    if wal:
+        con.execute("PRAGMA journal_mode = WAL")
+        con.execute("PRAGMA wal_autocheckpoint = 0")
+    con.executescript(PLACES_SCHEMA)
+    place_ids: dict[str, int] = {}
+    for minute, title, url in visits:
+        if url not in place_ids:
+            place_ids[url] = len(place_ids) + 1
+            con.execute(
+                "INSERT INTO moz_places (id, url, title) VALUES (?, ?, ?)",
+                (place_ids[url], url, title),
+            )
+        visit_date = int(make_dt(minute).timestamp() * 1_000_000)
+        con.execute(
+            "INSERT INTO moz_historyvisits (place_id, visit_date) VALUES (?, ?)",
+            (place_ids[url], visit_date),
+        )
+    con.commit()
+    return con
+
 
 @pytest.fixture
-def collector() -> FirefoxCollector:
+def collector(tmp_path: Path) -> FirefoxCollector:
     """Fixture for the Firefox Collector instance."""
-    return FirefoxCollector(config={})
+    return FirefoxCollector(config={"config_dir": str(tmp_path / "config")})
+
+
+@pytest.fixture
+def firefox_profile(tmp_path: Path) -> tuple[Path, Path]:
+    """Create a profiles.ini pointing to a profile with a places.sqlite file."""
+    base_path = tmp_path / "firefox"
+    profile_dir = base_path / "a.default"
+    profile_dir.mkdir(parents=True)
+    db_file = profile_dir / "places.sqlite"
+    db_file.touch()
+    profiles_ini = base_path / "profiles.ini"
+    profiles_ini.write_text("[Profile0]\nName=default\nPath=a.default\nIsRelative=1\n")
+    return profiles_ini, db_file
 
 
 @pytest.fixture
@@ -81,42 +143,39 @@ def test_get_base_paths_unsupported_os(
     assert paths == []
 
 
-@patch("configparser.ConfigParser")
 def test_parse_profiles_relative_and_priority(
-    mock_config_parser: MagicMock,
     collector: FirefoxCollector,
     mock_temp_home: Path,
 ):
     """Test parsing profiles.ini for relative paths and priority sorting."""
-    mock_profiles = {
-        "Profile0": {"Name": "default", "Path": "a.default", "IsRelative": "1"},
-        "Profile1": {"Name": "Nightly", "Path": "b.nightly", "IsRelative": "1"},
-        "Profile2": {
-            "Name": "absolute",
-            "Path": "/opt/firefox/absolute",
-            "IsRelative": "0",
-        },
-        "NotAProfile": {"Name": "some_other_section"},
-        "Profile3": {"Path": "d.default", "IsRelative": "1"},
-    }
-
-    def mock_get_item(section: str) -> MagicMock:
-        mock_section = MagicMock()
-        mock_section.get.side_effect = lambda option, fallback=None: mock_profiles.get(
-            section,
-            {},
-        ).get(option, fallback)
-        mock_section.getint.side_effect = lambda option, default: int(
-            mock_profiles.get(section, {}).get(option, default),
-        )
-
-        return mock_section
-
-    mock_config_parser.return_value.__getitem__.side_effect = mock_get_item
-    mock_config_parser.return_value.sections.return_value = mock_profiles.keys()
-    mock_config_parser.return_value.read.return_value = None
-
     mock_ini_path = mock_temp_home / "firefox-profiles" / "profiles.ini"
+    mock_ini_path.parent.mkdir()
+    mock_ini_path.write_text(
+        "[General]\n"
+        "StartWithLastProfile=1\n"
+        "\n"
+        "[Profile0]\n"
+        "Name=default\n"
+        "Path=a.default\n"
+        "IsRelative=1\n"
+        "\n"
+        "[Profile1]\n"
+        "Name=Nightly\n"
+        "Path=b.nightly\n"
+        "IsRelative=1\n"
+        "\n"
+        "[Profile2]\n"
+        "Name=absolute\n"
+        "Path=/opt/firefox/absolute\n"
+        "IsRelative=0\n"
+        "\n"
+        "[NotAProfile]\n"
+        "Name=some_other_section\n"
+        "\n"
+        "[Profile3]\n"
+        "Path=d.default\n"
+        "IsRelative=1\n",
+    )
 
     results = collector._parse_profiles(mock_ini_path)
 
@@ -133,36 +192,28 @@ def test_parse_profiles_relative_and_priority(
     assert results[2][2] == mock_temp_home / "firefox-profiles" / "a.default"
 
 
-@patch("configparser.ConfigParser")
 def test_parse_profiles_skips_invalid_sections(
-    mock_config_parser: MagicMock,
     collector: FirefoxCollector,
     mock_temp_home: Path,
 ):
     """Test that _parse_profiles skips non-profile or incomplete sections."""
-    mock_profiles = {
-        "Profile0": {"Name": "default", "Path": "a.default", "IsRelative": "1"},
-        "NotAProfile": {"Name": "some_other_section"},
-        "ProfileWithNoName": {"Path": "b.default", "IsRelative": "1"},
-        "ProfileWithNoPath": {"Name": "another_profile", "IsRelative": "1"},
-    }
-
-    def mock_get_item(section: str) -> MagicMock:
-        mock_section = MagicMock()
-        mock_section.get.side_effect = lambda option, fallback=None: mock_profiles.get(
-            section,
-            {},
-        ).get(option, fallback)
-        mock_section.getint.side_effect = lambda option, default: int(
-            mock_profiles.get(section, {}).get(option, default),
-        )
-        return mock_section
-
-    mock_config_parser.return_value.__getitem__.side_effect = mock_get_item
-    mock_config_parser.return_value.sections.return_value = mock_profiles.keys()
-    mock_config_parser.return_value.read.return_value = None
-
     mock_ini_path = mock_temp_home / "firefox-profiles" / "profiles.ini"
+    mock_ini_path.parent.mkdir()
+    mock_ini_path.write_text(
+        "; comment\n"
+        "[Profile0]\n"
+        "Name=default\n"
+        "Path=a.default\n"
+        "IsRelative=1\n"
+        "[NotAProfile]\n"
+        "Name=some_other_section\n"
+        "[ProfileWithNoName]\n"
+        "Path=b.default\n"
+        "IsRelative=1\n"
+        "[ProfileWithNoPath]\n"
+        "Name=another_profile\n"
+        "IsRelative=1\n",
+    )
 
     results = collector._parse_profiles(mock_ini_path)
 
@@ -170,6 +221,24 @@ def test_parse_profiles_skips_invalid_sections(
     assert results[0][1] == "default"
 
 
+def test_parse_profiles_falls_back_to_configparser(
+    collector: FirefoxCollector,
+    mock_temp_home: Path,
+):
+    """Test that lines the simple scan does not handle are left to ConfigParser."""
+    mock_ini_path = mock_temp_home / "firefox-profiles" / "profiles.ini"
+    mock_ini_path.parent.mkdir()
+    mock_ini_path.write_text(
+        "[Profile0]\nName: default\npath = a.default\nIsRelative=1\n",
+    )
+
+    results = collector._parse_profiles(mock_ini_path)
+
+    assert results == [
+        (1, "default", mock_temp_home / "firefox-profiles" / "a.default"),
+    ]
+
+
 @patch.object(FirefoxCollector, "_get_base_paths", return_value=[Path("/mock/path")])
 @patch("pathlib.Path.exists")
 def test_get_db_path_not_found(
@@ -194,16 +263,31 @@ def test_get_db_path_no_db_file(
 ):
     """Test returns None when profiles.ini exists but no places.sqlite is found."""
     profile_path = Path("/mock/base/profile_dir")
-    mock_path_exists.side_effect = [
-        True,
-        False,
-    ]
+    mock_path_exists.return_value = False
     mock_parse_profiles.return_value = [(1, "default", profile_path)]
     mock_base_paths.return_value = [Path("/mock/base")]
 
     assert collector._get_db_path() is None
 
 
+def test_get_db_path_skips_unreadable_profiles_ini(
+    collector: FirefoxCollector,
+    firefox_profile: tuple[Path, Path],
+    tmp_path: Path,
+):
+    """Test that a profiles.ini that cannot be read moves on to the next path."""
+    unreadable_base = tmp_path / "unreadable"
+    (unreadable_base / "profiles.ini").mkdir(parents=True)
+    profiles_ini, db_file = firefox_profile
+
+    with patch.object(
+        FirefoxCollector,
+        "_get_base_paths",
+        return_value=[unreadable_base, profiles_ini.parent],
+    ):
+        assert collector._get_db_path() == db_file
+
+
 @patch.object(FirefoxCollector, "_get_base_paths")
 @patch.object(FirefoxCollector, "_parse_profiles")
 @patch.object(Path, "exists")
@@ -215,7 +299,7 @@ def test_get_db_path_success(
 ):
     """Test returns the correct DB path when files exist."""
     profile_path = Path("/mock/base/profile_dir")
-    mock_path_exists.side_effect = [True, True]
+    mock_path_exists.return_value = True
     mock_parse_profiles.return_value = [(1, "default", profile_path)]
     mock_base_paths.return_value = [Path("/mock/base")]
 
@@ -223,6 +307,53 @@ def test_get_db_path_success(
     assert result == profile_path / "places.sqlite"
 
 
+def test_get_db_path_reuses_cached_lookup(
+    collector: FirefoxCollector,
+    firefox_profile: tuple[Path, Path],
+):
+    """Test that a resolved DB path is cached and reused by later collectors."""
+    profiles_ini, db_file = firefox_profile
+    with patch.object(
+        FirefoxCollector,
+        "_get_base_paths",
+        return_value=[profiles_ini.parent],
+    ):
+        assert collector._get_db_path() == db_file
+
+    assert collector.profile_cache_path.exists()
+
+    fresh_collector = FirefoxCollector(config=collector.config)
+    with patch.object(FirefoxCollector, "_find_db_path") as mock_find_db_path:
+        assert fresh_collector._get_db_path() == db_file
+    mock_find_db_path.assert_not_called()
+
+
+def test_get_db_path_cache_invalidated_when_profiles_change(
+    collector: FirefoxCollector,
+    firefox_profile: tuple[Path, Path],
+):
+    """Test that the cached DB path is ignored once profiles.ini is modified."""
+    profiles_ini, db_file = firefox_profile
+    with patch.object(
+        FirefoxCollector,
+        "_get_base_paths",
+        return_value=[profiles_ini.parent],
+    ):
+        collector._get_db_path()
+
+    mtime_ns = profiles_ini.stat().st_mtime_ns + 1_000_000_000
+    os.utime(profiles_ini, ns=(mtime_ns, mtime_ns))
+
+    fresh_collector = FirefoxCollector(config=collector.config)
+    with patch.object(
+        FirefoxCollector,
+        "_find_db_path",
+        return_value=db_file,
+    ) as mock_find_db_path:
+        assert fresh_collector._get_db_path() == db_file
+    mock_find_db_path.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_collect_raises_database_not_found(
     collector: FirefoxCollector,
@@ -264,9 +395,12 @@ async def test_collect_successful_query(
     ts_micros_1 = int(make_dt(10).timestamp() * 1_000_000)
     ts_micros_2 = int(make_dt(15).timestamp() * 1_000_000)
 
-    mock_cursor.execute.return_value = [
-        (ts_micros_1, "Project Dashboard - Jira", "https://jira.com"),
-        (ts_micros_2, "Async Python Guide", "https://docs.python.org"),
+    mock_cursor.fetchmany.side_effect = [
+        [
+            (ts_micros_1 / 1_000_000, "Project Dashboard - Jira", "https://jira.com"),
+            (ts_micros_2 / 1_000_000, "Async Python Guide", "https://docs.python.org"),
+        ],
+        [],
     ]
 
     mock_con = MagicMock()
@@ -290,3 +424,177 @@ async def test_collect_successful_query(
     assert events[0].source == "Firefox"
     assert events[0].description == "Project Dashboard - Jira"
     assert events[1].timestamp == make_dt(15)
+
+
+def test_tune_connection_applies_read_only_pragmas():
+    """Test that the pragma bundle is applied to the connection."""
+    con = sqlite3.connect(":memory:")
+    _tune_connection(con)
+
+    assert con.execute("PRAGMA query_only").fetchone() == (1,)
+    assert con.execute("PRAGMA temp_store").fetchone() == (2,)
+    assert con.execute("PRAGMA cache_size").fetchone() == (-65536,)
+    con.close()
+
+
+@pytest.mark.asyncio
+async def test_collect_reads_history_from_wal(
+    collector: FirefoxCollector,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that visits not yet checkpointed from the WAL are collected."""
+    db_path = tmp_path / "places.sqlite"
+    writer = create_places_db(
+        db_path,
+        [(10, "Recent visit", "https://example.com")],
+        wal=True,
+    )
+    assert db_path.with_name("places.sqlite-wal").stat().st_size > 0
+    monkeypatch.setattr(collector, "_get_db_path", lambda: db_path)
+
+    try:
+        events = await collector.collect(make_dt(0), make_dt(60))
+    finally:
+        writer.close()
+
+    assert [event.description for event in events] == ["Recent visit"]
+    assert events[0].timestamp == make_dt(10)
+
+
+@pytest.mark.asyncio
+async def test_collect_falls_back_to_immutable_read_when_locked(
+    collector: FirefoxCollector,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that an exclusively locked WAL database does not block the collector."""
+    db_path = tmp_path / "places.sqlite"
+    create_places_db(db_path, [(10, "Checkpointed visit", "https://example.com")])
+    writer = sqlite3.connect(db_path)
+    writer.execute("PRAGMA journal_mode = WAL")
+    writer.execute("PRAGMA locking_mode = EXCLUSIVE")
+    writer.execute("PRAGMA wal_autocheckpoint = 0")
+    writer.execute("INSERT INTO moz_historyvisits (place_id, visit_date) VALUES (1, 0)")
+    writer.commit()
+    assert db_path.with_name("places.sqlite-wal").exists()
+    monkeypatch.setattr(collector, "_get_db_path", lambda: db_path)
+
+    try:
+        events = await asyncio.wait_for(
+            collector.collect(make_dt(0), make_dt(60)),
+            timeout=5,
+        )
+    finally:
+        writer.close()
+
+    assert [event.description for event in events] == ["Checkpointed visit"]
+
+
+@pytest.mark.asyncio
+async def test_collect_reads_history_without_wal(
+    collector: FirefoxCollector,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that a database without a WAL file is read in immutable mode."""
+    db_path = tmp_path / "places.sqlite"
+    create_places_db(
+        db_path,
+        [
+            (10, "Inside range", "https://example.com/a"),
+            (70, "Outside range", "https://example.com/b"),
+        ],
+    ).close()
+    monkeypatch.setattr(collector, "_get_db_path", lambda: db_path)
+
+    events = await collector.collect(make_dt(0), make_dt(60))
+
+    assert [event.description for event in events] == ["Inside range"]
+
+
+@pytest.mark.asyncio
+async def test_collect_queries_history_in_worker_thread(
+    collector: FirefoxCollector,
+    event: Event,
+):
+    """Test that the blocking SQLite query runs outside the event loop thread."""
+    query_threads = []
+
+    def fake_query_history(start_time: datetime, end_time: datetime) -> list[Event]:
+        query_threads.append(threading.get_ident())
+        assert (start_time, end_time) == (make_dt(0), make_dt(60))
+        return [event]
+
+    with patch.object(collector, "_query_history", side_effect=fake_query_history):
+        events = await collector.collect(make_dt(0), make_dt(60))
+
+    assert events == [event]
+    assert query_threads
+    assert query_threads[0] != threading.get_ident()
+
+
+def test_analyze_if_needed_gathers_missing_statistics(tmp_path: Path):
+    """Test that a database without planner statistics is analyzed."""
+    con = create_places_db(
+        tmp_path / "places.sqlite",
+        [(10, "Visit", "https://example.com")],
+    )
+
+    _analyze_if_needed(con)
+    stats = con.execute("SELECT tbl, idx FROM sqlite_stat1").fetchall()
+    con.close()
+
+    assert ("moz_historyvisits", "moz_historyvisits_dateindex") in stats
+
+
+def test_connect_wal_copy_has_planner_statistics(
+    collector: FirefoxCollector,
+    tmp_path: Path,
+):
+    """Test that the in-memory copy of a WAL database is analyzed."""
+    db_path = tmp_path / "places.sqlite"
+    writer = create_places_db(
+        db_path,
+        [(10, "Visit", "https://example.com")],
+        wal=True,
+    )
+
+    try:
+        con = collector._connect(db_path)
+        stats = con.execute("SELECT tbl FROM sqlite_stat1").fetchall()
+        con.close()
+    finally:
+        writer.close()
+
+    assert ("moz_historyvisits",) in stats
+
+
+@pytest.mark.asyncio
+async def test_collect_dedup_hourly(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that repeated visits to a page are collapsed per hour when enabled."""
+    db_path = tmp_path / "places.sqlite"
+    create_places_db(
+        db_path,
+        [
+            (10, "Page A", "https://example.com/a"),
+            (20, "Page B", "https://example.com/b"),
+            (30, "Page A", "https://example.com/a"),
+            (70, "Page A", "https://example.com/a"),
+        ],
+    ).close()
+    collector = FirefoxCollector(
+        config={"config_dir": str(tmp_path / "config"), "dedup_hourly": True},
+    )
+    monkeypatch.setattr(collector, "_get_db_path", lambda: db_path)
+
+    events = await collector.collect(make_dt(0), make_dt(120))
+
+    assert [(event.timestamp, event.description) for event in events] == [
+        (make_dt(10), "Page A"),
+        (make_dt(20), "Page B"),
+        (make_dt(70), "Page A"),
+    ]
@@ -1,30 +1,57 @@
-from unittest.mock import MagicMock, patch
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 from google.oauth2.credentials import Credentials
 from googleapiclient.errors import HttpError
-from pyfakefs.fake_filesystem_unittest import FakeFilesystem
 
 from recall.collectors.gcalendar import (
+    EVENT_FIELDS,
+    SCOPES,
     GoogleCalendarCollector,
     GoogleCalendarCredentialsError,
+    _parse_start,
 )
 from tests.utils import make_dt
 
 
 @pytest.fixture
-def collector(fs: FakeFilesystem) -> GoogleCalendarCollector:
-    """Fixture for the GoogleCalendar Collector instance."""
-    config_dir = "/fake/config"
-    fs.create_dir(config_dir)
+def collector(tmp_path: Path) -> GoogleCalendarCollector:
+    """Fixture for a GoogleCalendar Collector with its config in tmp_path."""
     config = {
-        "config_dir": config_dir,
+        "config_dir": str(tmp_path),
         "credentials_filename": "creds.json",
         "token_filename": "token.json",
     }
     return GoogleCalendarCollector(config=config)
 
 
+@pytest.mark.parametrize(
+    ("start", "expected"),
+    [
+        pytest.param(
+            {"dateTime": "2025-01-01T10:00:00Z"},
+            datetime(2025, 1, 1, 10, 0, tzinfo=timezone.utc),
+            id="utc_z",
+        ),
+        pytest.param(
+            {"dateTime": "2025-01-01T10:00:00+02:00"},
+            datetime(2025, 1, 1, 8, 0, tzinfo=timezone.utc),
+            id="offset",
+        ),
+        pytest.param(
+            {"date": "2025-01-01"},
+            datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc),
+            id="all_day",
+        ),
+    ],
+)
+def test_parse_start(start: dict, expected: datetime):
+    """Test that event starts parse on every supported Python version."""
+    assert _parse_start(start) == expected
+
+
 @pytest.mark.asyncio
 @patch.object(
     GoogleCalendarCollector,
@@ -43,6 +70,22 @@ async def test_collect_raises_credentials_error(
     mock_get_credentials.assert_called_once()
 
 
+@pytest.mark.asyncio
+@patch.object(
+    GoogleCalendarCollector,
+    "_get_credentials",
+    side_effect=FileNotFoundError,
+)
+async def test_prepare_raises_credentials_error(
+    mock_get_credentials: MagicMock,
+    collector: GoogleCalendarCollector,
+):
+    """Test that prepare loads the credentials, failing if they are missing."""
+    with pytest.raises(GoogleCalendarCredentialsError):
+        await collector.prepare()
+    mock_get_credentials.assert_called_once()
+
+
 class MockCredentials(MagicMock):
     """Mock credentials with universe_domain property.
 
@@ -79,6 +122,7 @@ async def test_collect_successful(
     mock_service.events.return_value.list.return_value.execute.return_value = (
         mock_events_result
     )
+    mock_service.events.return_value.list_next.return_value = None
     mock_build.return_value = mock_service
 
     start_time, end_time = make_dt(0), make_dt(60)
@@ -104,6 +148,7 @@ async def test_collect_no_events(
     mock_service.events.return_value.list.return_value.execute.return_value = (
         mock_events_result
     )
+    mock_service.events.return_value.list_next.return_value = None
     mock_build.return_value = mock_service
 
     start_time, end_time = make_dt(0), make_dt(60)
@@ -136,6 +181,7 @@ async def test_collect_all_day_event(
     mock_service.events.return_value.list.return_value.execute.return_value = (
         mock_events_result
     )
+    mock_service.events.return_value.list_next.return_value = None
     mock_build.return_value = mock_service
 
     start_time, end_time = make_dt(0), make_dt(1440)
@@ -143,6 +189,7 @@ async def test_collect_all_day_event(
 
     assert len(events) == 1
     assert events[0].description == "Meeting: All-day Event"
+    assert events[0].timestamp == datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
 
 
 @pytest.mark.asyncio
@@ -160,6 +207,7 @@ async def test_collect_http_error(
         MagicMock(status=500),
         b"Internal Server Error",
     )
+    mock_service.events.return_value.list_next.return_value = None
     mock_build.return_value = mock_service
 
     start_time, end_time = make_dt(0), make_dt(60)
@@ -175,12 +223,11 @@ def test_get_credentials_no_token(
     mock_creds_from_file: MagicMock,
     mock_flow_from_file: MagicMock,
     mock_path_open: MagicMock,
-    fs: FakeFilesystem,
     collector: GoogleCalendarCollector,
 ):
     """Test the credential loading process when no token file exists."""
-    fs.create_file(collector.creds_path, contents="{}")
     assert not collector.token_path.exists()
+    mock_creds_from_file.side_effect = FileNotFoundError
 
     mock_flow = MagicMock()
     mock_flow.run_local_server.return_value = MockCredentials(
@@ -192,7 +239,7 @@ def test_get_credentials_no_token(
     creds = collector._get_credentials()
 
     assert creds.token == "new_token"
-    mock_creds_from_file.assert_not_called()
+    mock_creds_from_file.assert_called_once_with(collector.token_path, SCOPES)
     mock_path_open.assert_called_once_with(collector.token_path, "w")
 
 
@@ -201,15 +248,10 @@ def test_get_credentials_no_token(
 def test_get_credentials_valid_token(
     mock_creds_from_file: MagicMock,
     mock_path_open: MagicMock,
-    fs: FakeFilesystem,
     collector: GoogleCalendarCollector,
 ):
     """Test that a valid, existing token is loaded correctly."""
-    fs.create_file(collector.token_path, contents="{'token': 'old_token'}")
-    fs.create_file(collector.creds_path, contents="{}")
-    assert collector.token_path.exists()
-
-    mock_creds = MockCredentials(valid=True)
+    mock_creds = MockCredentials(valid=True, expiry=None)
     mock_creds_from_file.return_value = mock_creds
 
     creds = collector._get_credentials()
@@ -225,14 +267,9 @@ def test_get_credentials_expired_token(
     mock_flow_from_file: MagicMock,
     mock_creds_from_file: MagicMock,
     mock_path_open: MagicMock,
-    fs: FakeFilesystem,
     collector: GoogleCalendarCollector,
 ):
     """Test that an expired token is refreshed."""
-    fs.create_file(collector.token_path, contents='{"token": "expired_token"}')
-    fs.create_file(collector.creds_path, contents="{}")
-    assert collector.token_path.exists()
-
     mock_creds = MagicMock(
         spec=Credentials,
         valid=False,
@@ -248,3 +285,96 @@ def test_get_credentials_expired_token(
     mock_path_open.assert_called_once_with(collector.token_path, "w")
     assert creds == mock_creds
     mock_flow_from_file.assert_not_called()
+
+
+@patch("recall.collectors.gcalendar.Path.open")
+@patch("recall.collectors.gcalendar.Credentials.from_authorized_user_file")
+def test_get_credentials_reuses_cached_credentials(
+    mock_creds_from_file: MagicMock,
+    mock_path_open: MagicMock,
+    collector: GoogleCalendarCollector,
+):
+    """Test that valid credentials are only loaded from the token file once."""
+    expiry = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(hours=1)
+    mock_creds = MockCredentials(valid=True, expiry=expiry)
+    mock_creds_from_file.return_value = mock_creds
+
+    assert collector._get_credentials() is mock_creds
+    assert collector._get_credentials() is mock_creds
+
+    mock_creds_from_file.assert_called_once()
+    mock_path_open.assert_not_called()
+
+
+@patch("recall.collectors.gcalendar.Path.open")
+@patch("recall.collectors.gcalendar.Credentials.from_authorized_user_file")
+def test_get_credentials_refreshes_before_expiry(
+    mock_creds_from_file: MagicMock,
+    mock_path_open: MagicMock,
+    collector: GoogleCalendarCollector,
+):
+    """Test that credentials about to expire are refreshed proactively."""
+    expiry = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(minutes=1)
+    mock_creds = MockCredentials(valid=True, expiry=expiry, refresh_token="refresh")
+    mock_creds.to_json.return_value = '{"token": "refreshed_token"}'
+    mock_creds_from_file.return_value = mock_creds
+
+    creds = collector._get_credentials()
+
+    assert creds is mock_creds
+    mock_creds.refresh.assert_called_once()
+    mock_path_open.assert_called_once_with(collector.token_path, "w")
+
+
+@patch("recall.collectors.gcalendar.build")
+def test_get_service_reused_for_same_credentials(
+    mock_build: MagicMock,
+    collector: GoogleCalendarCollector,
+):
+    """Test that the API client is only rebuilt when the credentials change."""
+    creds = MockCredentials()
+
+    first = collector._get_service(creds)
+    second = collector._get_service(creds)
+    collector._get_service(MockCredentials())
+
+    assert first is second
+    assert mock_build.call_count == 2
+    mock_build.assert_called_with(
+        "calendar",
+        "v3",
+        credentials=ANY,
+        cache_discovery=False,
+        static_discovery=True,
+    )
+
+
+@pytest.mark.asyncio
+@patch("recall.collectors.gcalendar.build")
+@patch.object(GoogleCalendarCollector, "_get_credentials")
+async def test_collect_follows_result_pages(
+    mock_get_credentials: MagicMock,
+    mock_build: MagicMock,
+    collector: GoogleCalendarCollector,
+):
+    """Test that events are collected from every page of the API response."""
+    mock_get_credentials.return_value = MockCredentials()
+    events_resource = mock_build.return_value.events.return_value
+    first_page, second_page = MagicMock(), MagicMock()
+    events_resource.list.return_value = first_page
+    first_page.execute.return_value = {
+        "items": [{"summary": "First", "start": {"dateTime": "2025-01-01T09:10:00Z"}}],
+        "nextPageToken": "token",
+    }
+    second_page.execute.return_value = {
+        "items": [{"summary": "Second", "start": {"dateTime": "2025-01-01T09:20:00Z"}}],
+    }
+    events_resource.list_next.side_effect = [second_page, None]
+
+    events = await collector.collect(make_dt(0), make_dt(60))
+
+    assert [event.description for event in events] == [
+        "Meeting: First",
+        "Meeting: Second",
+    ]
+    assert events_resource.list.call_args.kwargs["fields"] == EVENT_FIELDS
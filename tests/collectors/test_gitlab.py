@@ -1,16 +1,27 @@
 from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
 import pytest
 from gitlab import GitlabAuthenticationError
 
-from recall.collectors.gitlab import GitLabCollector, GitlabError
+from recall.collectors.gitlab import (
+    EVENTS_PAGE_SIZE,
+    PAGE_FETCH_CONCURRENCY,
+    GitLabCollector,
+    GitlabError,
+    _parse_created_at,
+)
 from tests.utils import make_dt
 
+UTC_MINUS_5 = timezone(timedelta(hours=-5))
+UTC_PLUS_3 = timezone(timedelta(hours=3))
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def collector():
-    """Fixture for the GitLab Collector instance."""
+    """Fixture for the GitLab Collector instance, shared as it holds no state."""
     return GitLabCollector(
         config={
             "private_token": "fake_token",
@@ -20,33 +31,27 @@ def collector():
     )
 
 
-@pytest.fixture
+@dataclass(slots=True)
+class FakeGitLabEvent:
+    """A plain stand-in for the GitLab Event attributes the collector reads."""
+
+    action_name: str
+    target_type: str | None = None
+    target_title: str | None = None
+    target_iid: int | None = None
+    push_data: dict | None = None
+    note: dict | None = None
+    project_id: int = 123
+    created_at: str = "2025-01-01T09:00:00.000Z"
+
+
+@pytest.fixture(scope="module")
 def mock_gitlab_event_builder():
-    """Create mock GitLab Event objects for formatting tests.
+    """Create fake GitLab Event objects for formatting tests.
 
     This abstracts away the complexity of mock objects used in GitLab parsing tests.
     """
-
-    def _builder(
-        action_name: str,
-        target_type: str | None = None,
-        target_title: str | None = None,
-        target_iid: int | None = None,
-        push_data: dict | None = None,
-        note: dict | None = None,
-    ) -> MagicMock:
-        mock = MagicMock()
-        mock.action_name = action_name
-        mock.target_type = target_type
-        mock.target_title = target_title
-        mock.target_iid = target_iid
-        mock.push_data = push_data
-        mock.note = note
-        mock.project_id = 123
-        mock.created_at = "2025-01-01T09:00:00.000Z"
-        return mock
-
-    return _builder
+    return FakeGitLabEvent
 
 
 @pytest.fixture
@@ -59,114 +64,103 @@ def mock_gl_client_with_project():
     return mock_gl
 
 
-def test_format_summary_pushed_to(
-    collector: GitLabCollector,
-    mock_gitlab_event_builder: Callable,
-):
-    """Test summary formatting for a push event, extracting commit count and branch."""
-    event = mock_gitlab_event_builder(
-        "pushed to",
-        push_data={"commit_count": 3, "ref": "refs/heads/feature/awesome-feature"},
-    )
-    summary = collector._format_event_summary(event)
-    assert summary == "Pushed 3 commit(s) to branch 'awesome-feature'"
-
-
-def test_format_summary_commented_on(
-    collector: GitLabCollector,
-    mock_gitlab_event_builder: Callable,
-):
-    """Test summary formatting for a comment event."""
-    note_body = "Looks great, please confirm the timezone handling."
-    event = mock_gitlab_event_builder(
-        "commented on",
-        target_type="Issue",
-        note={"body": note_body},
-    )
-    summary = collector._format_event_summary(event)
-    assert summary == f"Commented on issue:\n\n{note_body}\n"
-
-
-def test_format_summary_opened_merge_request(
-    collector: GitLabCollector,
-    mock_gitlab_event_builder: Callable,
-):
-    """Test summary formatting for opening a merge request."""
-    event = mock_gitlab_event_builder(
-        "opened",
-        target_type="MergeRequest",
-        target_title="CI/CD Setup",
-    )
-    summary = collector._format_event_summary(event)
-    assert summary == "Opened mergerequest: CI/CD Setup"
-
-
-def test_format_summary_closed_issue(
-    collector: GitLabCollector,
-    mock_gitlab_event_builder: Callable,
-):
-    """Test summary formatting for closing an issue."""
-    event = mock_gitlab_event_builder(
-        "closed",
-        target_type="Issue",
-        target_title="Bug: Summarizer edge case",
-    )
-    summary = collector._format_event_summary(event)
-    assert summary == "Closed issue: Bug: Summarizer edge case"
-
-
-def test_format_summary_default_fallback(
-    collector: GitLabCollector,
-    mock_gitlab_event_builder: Callable,
-):
-    """Test the default summary format for unhandled event types."""
-    event = mock_gitlab_event_builder("approved", target_type="MergeRequest")
-    summary = collector._format_event_summary(event)
-    assert summary == "approved MergeRequest"
-
-
-def test_get_event_url_for_merge_request(
+@pytest.mark.parametrize(
+    ("event_kwargs", "expected"),
+    [
+        pytest.param(
+            {
+                "action_name": "pushed to",
+                "push_data": {"commit_count": 3, "ref": "refs/heads/feature/awesome"},
+            },
+            "Pushed 3 commit(s) to branch 'feature/awesome'",
+            id="pushed_to",
+        ),
+        pytest.param(
+            {
+                "action_name": "commented on",
+                "target_type": "Issue",
+                "note": {"body": "Please confirm the timezone."},
+            },
+            "Commented on issue:\n\nPlease confirm the timezone.\n",
+            id="commented_on",
+        ),
+        pytest.param(
+            {
+                "action_name": "opened",
+                "target_type": "MergeRequest",
+                "target_title": "CI/CD Setup",
+            },
+            "Opened mergerequest: CI/CD Setup",
+            id="opened_merge_request",
+        ),
+        pytest.param(
+            {
+                "action_name": "closed",
+                "target_type": "Issue",
+                "target_title": "Bug: Summarizer edge case",
+            },
+            "Closed issue: Bug: Summarizer edge case",
+            id="closed_issue",
+        ),
+        pytest.param(
+            {"action_name": "approved", "target_type": "MergeRequest"},
+            "approved MergeRequest",
+            id="default_fallback",
+        ),
+    ],
+)
+def test_format_event_summary(
     collector: GitLabCollector,
-    mock_gl_client_with_project: MagicMock,
     mock_gitlab_event_builder: Callable,
+    event_kwargs: dict,
+    expected: str,
 ):
-    """Test URL construction for a Merge Request with IID."""
-    project_cache = {}
-    event = mock_gitlab_event_builder(
-        "opened",
-        target_type="MergeRequest",
-        target_iid=15,
-    )
-    url = collector._get_event_url(event, project_cache, mock_gl_client_with_project)
-    assert url == "https://gitlab.com/group/project/-/merge_requests/15"
-
-
-def test_get_event_url_for_issue(
-    collector: GitLabCollector,
-    mock_gl_client_with_project: MagicMock,
-    mock_gitlab_event_builder: Callable,
-):
-    """Test URL construction for an Issue with IID."""
-    project_cache = {}
-    event = mock_gitlab_event_builder("opened", target_type="Issue", target_iid=20)
-    url = collector._get_event_url(event, project_cache, mock_gl_client_with_project)
-    assert url == "https://gitlab.com/group/project/-/issues/20"
-
-
-def test_get_event_url_for_pushed_to(
+    """Test summary formatting for each kind of GitLab event."""
+    event = mock_gitlab_event_builder(**event_kwargs)
+    assert collector._format_event_summary(event) == expected
+
+
+@pytest.mark.parametrize(
+    ("event_kwargs", "expected_path"),
+    [
+        pytest.param(
+            {"action_name": "opened", "target_type": "MergeRequest", "target_iid": 15},
+            "/-/merge_requests/15",
+            id="merge_request",
+        ),
+        pytest.param(
+            {"action_name": "opened", "target_type": "Issue", "target_iid": 20},
+            "/-/issues/20",
+            id="issue",
+        ),
+        pytest.param(
+            {"action_name": "pushed to", "push_data": {"ref": "refs/heads/dev"}},
+            "/-/commits/dev",
+            id="pushed_to",
+        ),
+        pytest.param(
+            {
+                "action_name": "commented on",
+                "target_type": "Issue",
+                "target_iid": 25,
+                "note": {"body": "A comment"},
+            },
+            "/-/issues/25",
+            id="comment_no_direct_link",
+        ),
+    ],
+)
+def test_get_event_url(
     collector: GitLabCollector,
     mock_gl_client_with_project: MagicMock,
     mock_gitlab_event_builder: Callable,
+    event_kwargs: dict,
+    expected_path: str,
 ):
-    """Test URL construction for a push event (links to the branch commits)."""
-    project_cache = {}
-    event = mock_gitlab_event_builder(
-        "pushed to",
-        push_data={"ref": "refs/heads/dev"},
-        target_type=None,
-    )
-    url = collector._get_event_url(event, project_cache, mock_gl_client_with_project)
-    assert url == "https://gitlab.com/group/project/-/commits/dev"
+    """Test URL construction from the project URL and the event's target."""
+    event = mock_gitlab_event_builder(**event_kwargs)
+    url = collector._get_event_url(event, {}, mock_gl_client_with_project)
+    assert url == f"https://gitlab.com/group/project{expected_path}"
 
 
 def test_get_event_url_for_comment_direct_link(
@@ -180,23 +174,6 @@ def test_get_event_url_for_comment_direct_link(
     assert url == expected_url
 
 
-def test_get_event_url_for_comment_no_direct_link(
-    collector: GitLabCollector,
-    mock_gl_client_with_project: MagicMock,
-    mock_gitlab_event_builder: Callable,
-):
-    """Test URL generation for a comment without a direct link."""
-    project_cache = {}
-    event = mock_gitlab_event_builder(
-        "commented on",
-        target_type="Issue",
-        target_iid=25,
-        note={"body": "A comment"},
-    )
-    url = collector._get_event_url(event, project_cache, mock_gl_client_with_project)
-    assert url == "https://gitlab.com/group/project/-/issues/25"
-
-
 def test_get_event_url_project_lookup_failure(
     collector: GitLabCollector,
     mock_gitlab_event_builder: Callable,
@@ -376,3 +353,245 @@ async def test_collect_successful(
 
     assert len(events) == 1
     assert events[0].description == "Pushed 1 commit(s) to branch 'main'"
+
+
+def test_fetch_project_urls_batches_graphql_queries(collector: GitLabCollector):
+    """Test that project URLs are fetched in GraphQL batches of one hundred."""
+    mock_gl_client = MagicMock()
+    mock_gl_client.url = "https://fake-gitlab.com"
+
+    def http_post(_url: str, post_data: dict) -> dict:
+        nodes = [
+            {"id": gid, "webUrl": f"https://gitlab.com/p/{gid.rsplit('/', 1)[-1]}"}
+            for gid in post_data["variables"]["ids"]
+        ]
+        return {"data": {"projects": {"nodes": nodes}}}
+
+    mock_gl_client.http_post.side_effect = http_post
+
+    project_urls = collector._fetch_project_urls(set(range(1, 151)), mock_gl_client)
+
+    assert len(project_urls) == 150
+    assert project_urls[42] == "https://gitlab.com/p/42"
+    assert mock_gl_client.http_post.call_count == 2
+    assert (
+        mock_gl_client.http_post.call_args.args[0]
+        == "https://fake-gitlab.com/api/graphql"
+    )
+
+
+def test_fetch_project_urls_handles_gitlab_error(collector: GitLabCollector):
+    """Test that a failed GraphQL query leaves every project to the REST lookup."""
+    mock_gl_client = MagicMock()
+    mock_gl_client.http_post.side_effect = GitlabError("GraphQL unavailable")
+
+    assert collector._fetch_project_urls({1, 2}, mock_gl_client) == {}
+
+
+@pytest.mark.asyncio
+@patch("gitlab.Gitlab")
+async def test_collect_uses_graphql_project_urls(
+    mock_gitlab: MagicMock,
+    collector: GitLabCollector,
+    mock_gitlab_event_builder: Callable,
+):
+    """Test that project URLs resolved via GraphQL skip the REST project lookup."""
+    mock_user = MagicMock()
+    mock_user.events.list.return_value = [
+        mock_gitlab_event_builder("opened", target_type="Issue", target_iid=7),
+    ]
+    mock_gl_instance = mock_gitlab.return_value
+    mock_gl_instance.users.get.return_value = mock_user
+    mock_gl_instance.http_post.return_value = {
+        "data": {
+            "projects": {
+                "nodes": [
+                    {
+                        "id": "gid://gitlab/Project/123",
+                        "webUrl": "https://gitlab.com/group/project",
+                    },
+                ],
+            },
+        },
+    }
+
+    events = await collector.collect(make_dt(0), make_dt(60))
+
+    assert events[0].url == "https://gitlab.com/group/project/-/issues/7"
+    mock_gl_instance.projects.get.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_list_events_fetches_pages_until_short_page(
+    collector: GitLabCollector,
+    mock_gitlab_event_builder: Callable,
+):
+    """Test that event pages are fetched until a page is not full."""
+    page_sizes = {1: EVENTS_PAGE_SIZE, 2: EVENTS_PAGE_SIZE, 3: 5}
+    mock_user = MagicMock()
+
+    def list_events(
+        after: str,
+        before: str,
+        sort: str,
+        page: int,
+        per_page: int,
+    ) -> list[FakeGitLabEvent]:
+        assert (after, before, sort) == ("2024-12-31", "2025-01-02", "desc")
+        assert per_page == EVENTS_PAGE_SIZE
+        return [
+            mock_gitlab_event_builder("joined") for _ in range(page_sizes.get(page, 0))
+        ]
+
+    mock_user.events.list.side_effect = list_events
+
+    events = await collector._list_events(mock_user, ("2024-12-31", "2025-01-02"))
+
+    assert len(events) == 2 * EVENTS_PAGE_SIZE + 5
+    requested_pages = {
+        call.kwargs["page"] for call in mock_user.events.list.call_args_list
+    }
+    assert requested_pages == {1, *range(2, 2 + PAGE_FETCH_CONCURRENCY)}
+
+
+@pytest.mark.asyncio
+async def test_list_events_stops_at_events_older_than_range(
+    collector: GitLabCollector,
+    mock_gitlab_event_builder: Callable,
+):
+    """Test that no further pages are fetched once a page predates the range."""
+    mock_user = MagicMock()
+    mock_user.events.list.return_value = [
+        mock_gitlab_event_builder("joined") for _ in range(EVENTS_PAGE_SIZE)
+    ]
+
+    events = await collector._list_events(
+        mock_user,
+        ("2024-12-31", "2025-01-02"),
+        make_dt(30),
+    )
+
+    assert len(events) == EVENTS_PAGE_SIZE
+    mock_user.events.list.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_resolve_project_urls_falls_back_to_rest_for_missing_projects(
+    collector: GitLabCollector,
+    mock_gl_client_with_project: MagicMock,
+):
+    """Test that only projects missing from the GraphQL result use REST lookups."""
+    with patch.object(
+        collector,
+        "_fetch_project_urls",
+        return_value={1: "https://gitlab.com/group/one"},
+    ):
+        project_urls = await collector._resolve_project_urls(
+            {1, 2},
+            mock_gl_client_with_project,
+        )
+
+    assert project_urls == {
+        1: "https://gitlab.com/group/one",
+        2: "https://gitlab.com/group/project",
+    }
+    mock_gl_client_with_project.projects.get.assert_called_once_with(2)
+
+
+@pytest.mark.parametrize(
+    ("created_at", "expected"),
+    [
+        ("2025-01-01T09:00:00.000Z", make_dt(0)),
+        ("2025-01-01T11:30:00.000+02:00", make_dt(30)),
+        ("2025-01-01T09:15:00", make_dt(15)),
+    ],
+)
+def test_parse_created_at(created_at: str, expected: datetime):
+    """Test that GitLab timestamps keep their offset and default to UTC."""
+    assert _parse_created_at(created_at) == expected
+
+
+@pytest.mark.parametrize(
+    ("start_time", "end_time", "created_ats", "expected", "dates"),
+    [
+        pytest.param(
+            make_dt(0),
+            make_dt(60),
+            ["2025-01-01T08:59:59.000Z", "2025-01-01T09:30:00.000Z"],
+            [make_dt(30)],
+            ("2024-12-31", "2025-01-02"),
+            id="utc",
+        ),
+        pytest.param(
+            datetime(2025, 1, 1, 20, 0, 0, tzinfo=UTC_MINUS_5),
+            datetime(2025, 1, 1, 23, 59, 59, tzinfo=UTC_MINUS_5),
+            ["2025-01-02T00:59:59.000Z", "2025-01-02T02:00:00.000Z"],
+            [datetime(2025, 1, 2, 2, 0, 0, tzinfo=timezone.utc)],
+            ("2025-01-01", "2025-01-03"),
+            id="west_of_utc",
+        ),
+        pytest.param(
+            datetime(2025, 1, 2, 0, 0, 0, tzinfo=UTC_PLUS_3),
+            datetime(2025, 1, 2, 23, 59, 59, tzinfo=UTC_PLUS_3),
+            ["2025-01-01T20:59:59.000Z", "2025-01-01T22:00:00.000Z"],
+            [datetime(2025, 1, 1, 22, 0, 0, tzinfo=timezone.utc)],
+            ("2024-12-31", "2025-01-03"),
+            id="east_of_utc",
+        ),
+    ],
+)
+@pytest.mark.asyncio
+@patch("gitlab.Gitlab")
+async def test_collect_filters_events_by_date_range(
+    mock_gitlab: MagicMock,
+    collector: GitLabCollector,
+    mock_gitlab_event_builder: Callable,
+    start_time: datetime,
+    end_time: datetime,
+    created_ats: list[str],
+    expected: list[datetime],
+    dates: tuple[str, str],
+):
+    """Test that events are requested by UTC date and filtered to the exact range."""
+    mock_user = MagicMock()
+    api_events = []
+    for created_at in created_ats:
+        api_event = mock_gitlab_event_builder("joined")
+        api_event.created_at = created_at
+        api_events.append(api_event)
+    mock_user.events.list.return_value = api_events
+    mock_gitlab.return_value.users.get.return_value = mock_user
+
+    events = await collector.collect(start_time, end_time)
+
+    assert [event.timestamp for event in events] == expected
+    list_kwargs = mock_user.events.list.call_args.kwargs
+    assert (list_kwargs["after"], list_kwargs["before"]) == dates
+
+
+@pytest.mark.asyncio
+async def test_resolve_project_urls_fetches_every_missing_project(
+    collector: GitLabCollector,
+):
+    """Test that every project missing from GraphQL is looked up, failures as None."""
+    mock_gl_client = MagicMock()
+
+    def get_project(project_id: int) -> MagicMock:
+        if project_id == 3:
+            raise GitlabError
+        return MagicMock(web_url=f"https://gitlab.com/group/{project_id}")
+
+    mock_gl_client.projects.get.side_effect = get_project
+
+    with patch.object(collector, "_fetch_project_urls", return_value={}):
+        project_urls = await collector._resolve_project_urls(
+            {1, 2, 3},
+            mock_gl_client,
+        )
+
+    assert project_urls == {
+        1: "https://gitlab.com/group/1",
+        2: "https://gitlab.com/group/2",
+        3: None,
+    }
+    assert mock_gl_client.projects.get.call_count == 3
@@ -1,19 +1,27 @@
 import io
+import threading
 from datetime import datetime, timezone
-from unittest.mock import MagicMock, patch
+from pathlib import Path
+from unittest.mock import patch
 
 import pytest
-from pyfakefs.fake_filesystem import FakeFilesystem
 from rich.console import Console
 
-from recall.collectors.shell import ShellCollector
+from recall.collectors.base import Event
+from recall.collectors.shell import (
+    ShellCollector,
+    _normalize_utc_offset,
+    _parse_line,
+    _parse_timestamp,
+    _read_lines_reversed,
+)
 from tests.utils import make_dt, strip_ansi
 
 
 @pytest.fixture
-def collector():
-    """Fixture for the Shell Collector instance."""
-    return ShellCollector(config={})
+def collector(tmp_path: Path):
+    """Fixture for the Shell Collector instance, logging under tmp_path."""
+    return ShellCollector(config={"log_file_path": str(tmp_path / "shell.log")})
 
 
 @pytest.fixture
@@ -27,7 +35,7 @@ def capture_rich_text(monkeypatch: pytest.MonkeyPatch) -> io.StringIO:
     capturing_console = Console(
         file=output_buffer,
         force_terminal=True,
-        width=80,
+        width=200,
         record=True,
     )
     monkeypatch.setattr("recall.collectors.shell.console", capturing_console)
@@ -39,58 +47,105 @@ def test_name(collector: ShellCollector):
     assert collector.name() == "Shell"
 
 
-def test_parse_line_valid_iso_line(collector: ShellCollector):
+@pytest.mark.parametrize("chunk_size", [1, 4, 1024])
+def test_read_lines_reversed(chunk_size: int):
+    """Test that lines are yielded last to first regardless of the chunk size."""
+    f = io.BytesIO(b"first\nsecond line\n\nlast")
+
+    lines = list(_read_lines_reversed(f, chunk_size))
+
+    assert lines == [b"last", b"", b"second line", b"first"]
+
+
+def test_parse_line_valid_iso_line():
     """Test a correctly formatted line with a timezone offset."""
-    line = "2025-09-28T10:30:15+03:00 git status"
+    line = b"2025-09-28T10:30:15+03:00 git status"
 
-    result = collector._parse_line(line)
+    result = _parse_line(line)
     assert result is not None
 
     timestamp, command = result
     assert timestamp.tzinfo is not None
-    assert command == "git status"
+    assert command == b"git status"
 
 
-def test_parse_line_with_utc_time(collector: ShellCollector):
+def test_parse_line_with_utc_time():
     """Test a correctly formatted line with UTC time."""
-    line = "2025-10-08T14:45:00Z uv build"
+    line = b"2025-10-08T14:45:00Z uv build"
     expected_utc = datetime(2025, 10, 8, 14, 45, 0, tzinfo=timezone.utc)
 
-    result = collector._parse_line(line)
+    result = _parse_line(line)
     assert result is not None
 
     timestamp, command = result
     assert timestamp.astimezone(timezone.utc) == expected_utc
-    assert command == "uv build"
+    assert command == b"uv build"
+
+
+def test_parse_line_naive_timestamp_is_local_time():
+    """Test that a timestamp without an offset is interpreted as local time."""
+    line = b"2025-10-08T14:45:00 ls -la"
+
+    result = _parse_line(line)
+    assert result is not None
+
+    timestamp, command = result
+    assert timestamp == datetime(2025, 10, 8, 14, 45).astimezone()
+    assert command == b"ls -la"
+
+
+@pytest.mark.parametrize(
+    ("timestamp_str", "expected"),
+    [
+        ("2025-10-08T14:45:00Z", "2025-10-08T14:45:00+00:00"),
+        ("2025-10-08T14:45:00+0300", "2025-10-08T14:45:00+03:00"),
+        ("2025-10-08T14:45:00-0530", "2025-10-08T14:45:00-05:30"),
+        ("2025-10-08T14:45:00+03:00", "2025-10-08T14:45:00+03:00"),
+        ("2025-10-08T14:45:00", "2025-10-08T14:45:00"),
+    ],
+)
+def test_normalize_utc_offset(timestamp_str: str, expected: str):
+    """Test that Z and +HHMM offsets are rewritten in the +HH:MM form."""
+    assert _normalize_utc_offset(timestamp_str) == expected
+
+
+def test_parse_line_offset_without_colon():
+    """Test a line timestamped with date's %z format, as the shell hooks write."""
+    line = b"2025-10-08T14:45:00+0300 make test"
+    expected_utc = datetime(2025, 10, 8, 11, 45, 0, tzinfo=timezone.utc)
+
+    result = _parse_line(line)
+    assert result is not None
+
+    timestamp, command = result
+    assert timestamp == expected_utc
+    assert command == b"make test"
 
 
-def test_parse_line_invalid_timestamp_format(collector: ShellCollector):
+def test_parse_line_invalid_timestamp_format():
     """Test a line with an invalid or ambiguous timestamp format (e.g., missing T)."""
-    line = "2025-09-28TXX:30:15+03:00 invalid command"
-    assert collector._parse_line(line) is None
+    line = b"2025-09-28TXX:30:15+03:00 invalid command"
+    assert _parse_line(line) is None
 
 
-def test_parse_line_missing_command_part(collector: ShellCollector):
+def test_parse_line_missing_command_part():
     """Test a line that contains only the timestamp (missing the second part)."""
-    line = "2025-09-28T10:30:15+03:00"
-    assert collector._parse_line(line) is None
+    line = b"2025-09-28T10:30:15+03:00"
+    assert _parse_line(line) is None
 
 
-def test_parse_line_command_with_internal_quotes_and_whitespace(
-    collector: ShellCollector,
-):
+def test_parse_line_command_with_internal_quotes_and_whitespace():
     """Test a command that contains extra whitespace is handled correctly."""
-    line = "2025-09-28T10:30:15+03:00  docker-compose up --build -d "
-    result = collector._parse_line(line)
+    line = b"2025-09-28T10:30:15+03:00  docker-compose up --build -d "
+    result = _parse_line(line)
     assert result is not None
 
     _, command = result
-    assert command == "docker-compose up --build -d"
+    assert command == b"docker-compose up --build -d"
 
 
 @pytest.mark.asyncio
 async def test_collect_no_log_file(
-    fs: FakeFilesystem,
     collector: ShellCollector,
     capture_rich_text: io.StringIO,
 ):
@@ -103,27 +158,24 @@ async def test_collect_no_log_file(
     expected_message = f"Shell history log file {expected_path} not found."
     assert expected_message == output
     assert events == []
-    assert fs.exists(expected_path) is False
+    assert not expected_path.exists()
 
 
 @pytest.mark.asyncio
-@patch("recall.collectors.shell.Path.open")
-@patch("recall.collectors.shell.Path.home")
-async def test_collect_os_error(
-    mock_home: MagicMock,
-    mock_open: MagicMock,
-    collector: ShellCollector,
-):
+async def test_collect_os_error(collector: ShellCollector):
     """Test that an empty list is returned on OSError."""
-    mock_home.return_value.joinpath.return_value.exists.return_value = True
-    mock_open.side_effect = OSError
-    events = await collector.collect(make_dt(0), make_dt(60))
+    collector.log_file_path.write_text("2025-01-01T09:00:00Z command\n")
+    with patch(
+        "recall.collectors.shell.Path.open",
+        side_effect=OSError,
+    ) as mock_open:
+        events = await collector.collect(make_dt(0), make_dt(60))
     assert events == []
+    mock_open.assert_called_once()
 
 
 @pytest.mark.asyncio
 async def test_collect_skips_invalid_lines(
-    fs: FakeFilesystem,
     collector: ShellCollector,
 ):
     """Test that invalid lines in the log file are skipped."""
@@ -132,7 +184,7 @@ async def test_collect_skips_invalid_lines(
         "this is not a valid line",
         "2025-01-01T09:00:00Z valid_command",
     ]
-    fs.create_file(log_path, contents="\n".join(log_content))
+    log_path.write_text("\n".join(log_content))
 
     start_time, end_time = make_dt(0), make_dt(60)
     events = await collector.collect(start_time, end_time)
@@ -143,7 +195,6 @@ async def test_collect_skips_invalid_lines(
 
 @pytest.mark.asyncio
 async def test_collect_filters_by_time(
-    fs: FakeFilesystem,
     collector: ShellCollector,
 ):
     """Test that events are correctly filtered by the given time range."""
@@ -154,7 +205,7 @@ async def test_collect_filters_by_time(
         "2025-01-01T09:00:01Z another_within",
         "2025-01-01T10:00:01Z command_after",
     ]
-    fs.create_file(log_path, contents="\n".join(log_content))
+    log_path.write_text("\n".join(log_content))
 
     start_time, end_time = make_dt(0), make_dt(60)
     events = await collector.collect(start_time, end_time)
@@ -162,3 +213,64 @@ async def test_collect_filters_by_time(
     assert len(events) == 2
     assert events[0].description == "command_within"
     assert events[1].description == "another_within"
+
+
+@pytest.mark.asyncio
+async def test_collect_stops_scanning_before_start_time(
+    collector: ShellCollector,
+):
+    """Test that commands long before the start time are not parsed."""
+    log_content = [
+        "2024-12-31T09:00:00Z old_command",
+        "2025-01-01T08:50:00Z earlier_command",
+        "2025-01-01T08:59:00Z slightly_out_of_order",
+        "2025-01-01T09:10:00Z command_within",
+        "2025-01-01T09:05:00Z appended_late",
+    ]
+    collector.log_file_path.write_text("\n".join(log_content) + "\n")
+
+    with patch(
+        "recall.collectors.shell._parse_timestamp",
+        wraps=_parse_timestamp,
+    ) as mock_parse_timestamp:
+        events = await collector.collect(make_dt(0), make_dt(60))
+
+    assert [event.description for event in events] == [
+        "command_within",
+        "appended_late",
+    ]
+    parsed = [call.args[0] for call in mock_parse_timestamp.call_args_list]
+    assert "2024-12-31T09:00:00Z" not in parsed
+
+
+@pytest.mark.asyncio
+async def test_collect_decodes_utf8_commands(
+    collector: ShellCollector,
+):
+    """Test that non-ASCII commands are decoded from the binary log."""
+    collector.log_file_path.write_bytes(
+        "2025-01-01T09:10:00Z echo 'hyvää päivää'  \n".encode(),
+    )
+
+    events = await collector.collect(make_dt(0), make_dt(60))
+
+    assert [event.description for event in events] == ["echo 'hyvää päivää'"]
+
+
+@pytest.mark.asyncio
+async def test_collect_reads_log_in_worker_thread(collector: ShellCollector):
+    """Test that the blocking file scan runs outside the event loop thread."""
+    collector.log_file_path.write_text("2025-01-01T09:10:00Z ls\n")
+    read_threads = []
+    read_events = collector._read_events
+
+    def tracking_read_events(start_time: datetime, end_time: datetime) -> list[Event]:
+        read_threads.append(threading.get_ident())
+        return read_events(start_time, end_time)
+
+    with patch.object(collector, "_read_events", side_effect=tracking_read_events):
+        events = await collector.collect(make_dt(0), make_dt(60))
+
+    assert [event.description for event in events] == ["ls"]
+    assert read_threads
+    assert read_threads[0] != threading.get_ident()
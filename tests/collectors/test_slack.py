@@ -1,16 +1,49 @@
+import json
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 from slack_sdk.errors import SlackApiError
 
-from recall.collectors.slack import SlackCollector
+from recall.collectors.slack import SEARCH_PAGE_CONCURRENCY, SlackCollector
 from tests.utils import make_dt
 
 
+def write_user_cache(
+    cache_path: Path,
+    users: dict[str, str],
+    age_seconds: float = 0,
+) -> None:
+    """Write a user map cache as if the member list was fetched age_seconds ago."""
+    cache = {"fetched_at": time.time() - age_seconds, "users": users}
+    cache_path.write_text(json.dumps(cache))
+
+
+def read_cached_users(cache_path: Path) -> dict[str, str]:
+    """Return the user map stored in a user map cache."""
+    return json.loads(cache_path.read_text())["users"]
+
+
 @pytest.fixture
-def collector():
+def collector(tmp_path: Path):
     """Fixture for the Slack Collector instance."""
-    return SlackCollector(config={"user_token": "fake-token"})
+    return SlackCollector(
+        config={"user_token": "fake-token", "config_dir": str(tmp_path)},
+    )
+
+
+@pytest.fixture
+def mock_client():
+    """Mock the Slack WebClient with empty, successful API responses."""
+    with patch("recall.collectors.slack.WebClient") as mock_web_client:
+        client = mock_web_client.return_value
+        client.auth_test.return_value = {"team_id": "T123"}
+        client.users_list.return_value = {"members": []}
+        client.search_messages.return_value = {"messages": {"matches": []}}
+        yield client
 
 
 @pytest.fixture
@@ -49,6 +82,24 @@ def test_replace_user_mentions_with_optional_name(
     assert collector._replace_user_mentions(text, mock_slack_user_map) == expected
 
 
+def test_replace_user_mentions_adjacent_labelled_mentions(
+    collector: SlackCollector,
+    mock_slack_user_map: dict,
+):
+    """Test that a mention label never extends past its closing bracket."""
+    text = "<@U01A|al><@U02B|bobby> pair up"
+    expected = "@alice@bob pair up"
+    assert collector._replace_user_mentions(text, mock_slack_user_map) == expected
+
+
+def test_replace_user_mentions_enterprise_grid_id(collector: SlackCollector):
+    """Test that Enterprise Grid user IDs, which start with W, are replaced."""
+    text = "Ask <@W07D> about it"
+    assert (
+        collector._replace_user_mentions(text, {"W07D": "dana"}) == "Ask @dana about it"
+    )
+
+
 def test_replace_user_mentions_unmapped_id(
     collector: SlackCollector,
     mock_slack_user_map: dict,
@@ -90,15 +141,12 @@ async def test_collect_missing_token():
 
 
 @pytest.mark.asyncio
-@patch("recall.collectors.slack.WebClient")
 async def test_collect_auth_failure(
-    mock_web_client: MagicMock,
+    mock_client: MagicMock,
     collector: SlackCollector,
-    monkeypatch: pytest.MonkeyPatch,
 ):
     """Test that a ConnectionError is raised on Slack authentication failure."""
-    monkeypatch.setenv("SLACK_USER_TOKEN", "fake-token")
-    mock_web_client.return_value.auth_test.side_effect = SlackApiError(
+    mock_client.auth_test.side_effect = SlackApiError(
         "auth failed",
         MagicMock(),
     )
@@ -109,17 +157,12 @@ async def test_collect_auth_failure(
 
 @pytest.mark.asyncio
 @patch("recall.collectors.slack.console")
-@patch("recall.collectors.slack.WebClient")
 async def test_collect_users_list_fails(
-    mock_web_client: MagicMock,
     mock_console: MagicMock,
+    mock_client: MagicMock,
     collector: SlackCollector,
-    monkeypatch: pytest.MonkeyPatch,
 ):
     """Test that a warning is printed if fetching the user list fails."""
-    monkeypatch.setenv("SLACK_USER_TOKEN", "fake-token")
-    mock_client = mock_web_client.return_value
-
     mock_response = MagicMock()
     mock_response.__getitem__.return_value = "test_error"
     mock_client.users_list.side_effect = SlackApiError(
@@ -127,8 +170,6 @@ async def test_collect_users_list_fails(
         mock_response,
     )
 
-    mock_client.search_messages.return_value = {"messages": {"matches": []}}
-
     await collector.collect(make_dt(0), make_dt(60))
 
     mock_console.print.assert_called_with(
@@ -137,15 +178,45 @@ async def test_collect_users_list_fails(
 
 
 @pytest.mark.asyncio
-@patch("recall.collectors.slack.WebClient")
+@patch("recall.collectors.slack.console")
+async def test_collect_users_list_failure_writes_no_cache(
+    mock_console: MagicMock,
+    mock_client: MagicMock,
+    collector: SlackCollector,
+):
+    """Test that users looked up after a failed users_list are not cached."""
+    mock_client.users_list.side_effect = SlackApiError(
+        "users list failed",
+        {"error": "ratelimited"},
+    )
+    mock_client.users_info.return_value = {"user": {"id": "U02B", "name": "bob"}}
+    mock_client.search_messages.return_value = {
+        "messages": {
+            "matches": [
+                {
+                    "ts": str(make_dt(15).timestamp()),
+                    "channel": {"name": "general"},
+                    "text": "Ping <@U02B>",
+                },
+            ],
+        },
+    }
+
+    events = await collector.collect(make_dt(0), make_dt(60))
+
+    mock_console.print.assert_called_once_with(
+        "Warning: Could not fetch user list from Slack: ratelimited",
+    )
+    assert "@bob" in events[0].description
+    assert not collector._user_cache_path("T123").exists()
+
+
+@pytest.mark.asyncio
 async def test_collect_handles_users_without_id_or_name(
-    mock_web_client: MagicMock,
+    mock_client: MagicMock,
     collector: SlackCollector,
-    monkeypatch: pytest.MonkeyPatch,
 ):
     """Test that users without an id or name are skipped gracefully."""
-    monkeypatch.setenv("SLACK_USER_TOKEN", "fake-token")
-    mock_client = mock_web_client.return_value
     mock_client.users_list.return_value = {
         "members": [
             {"id": "U01A", "name": "alice"},
@@ -153,23 +224,164 @@ async def test_collect_handles_users_without_id_or_name(
             {"id": "U02B"},
         ],
     }
-    mock_client.search_messages.return_value = {"messages": {"matches": []}}
     await collector.collect(make_dt(0), make_dt(60))
 
+    cache_path = collector._user_cache_path("T123")
+    assert read_cached_users(cache_path) == {"U01A": "alice"}
+
+
+@pytest.mark.asyncio
+async def test_collect_follows_users_list_pagination(
+    mock_client: MagicMock,
+    collector: SlackCollector,
+):
+    """Test that every page of the workspace member list is fetched."""
+    mock_client.users_list.side_effect = [
+        {
+            "members": [{"id": "U01A", "name": "alice"}],
+            "response_metadata": {"next_cursor": "next"},
+        },
+        {
+            "members": [{"id": "U02B", "name": "bob"}],
+            "response_metadata": {"next_cursor": ""},
+        },
+    ]
+
+    await collector.collect(make_dt(0), make_dt(60))
+
+    assert mock_client.users_list.call_count == 2
+    assert mock_client.users_list.call_args.kwargs["cursor"] == "next"
+    cache_path = collector._user_cache_path("T123")
+    assert read_cached_users(cache_path) == {"U01A": "alice", "U02B": "bob"}
+
+
+@pytest.mark.asyncio
+async def test_collect_uses_fresh_user_cache(
+    mock_client: MagicMock,
+    collector: SlackCollector,
+):
+    """Test that a fresh cached user map skips the users_list API call."""
+    cache_path = collector._user_cache_path("T123")
+    write_user_cache(cache_path, {"U01A": "alice"})
+    mock_client.search_messages.return_value = {
+        "messages": {
+            "matches": [
+                {
+                    "ts": str(make_dt(15).timestamp()),
+                    "channel": {"name": "general"},
+                    "text": "Hello <@U01A>",
+                },
+            ],
+        },
+    }
+
+    events = await collector.collect(make_dt(0), make_dt(60))
+
+    mock_client.users_list.assert_not_called()
+    assert "@alice" in events[0].description
+
+
+@pytest.mark.asyncio
+async def test_collect_refreshes_stale_user_cache(
+    mock_client: MagicMock,
+    collector: SlackCollector,
+):
+    """Test that a user map cache older than the TTL is refetched."""
+    cache_path = collector._user_cache_path("T123")
+    write_user_cache(cache_path, {"U01A": "old_alice"}, age_seconds=2 * 24 * 60 * 60)
+    mock_client.users_list.return_value = {
+        "members": [{"id": "U01A", "name": "alice"}],
+    }
+
+    await collector.collect(make_dt(0), make_dt(60))
+
+    mock_client.users_list.assert_called_once()
+    assert read_cached_users(cache_path) == {"U01A": "alice"}
+    assert list(cache_path.parent.iterdir()) == [cache_path]
+
+
+@pytest.mark.asyncio
+async def test_collect_resolves_unknown_mentions(
+    mock_client: MagicMock,
+    collector: SlackCollector,
+):
+    """Test that mentions missing from the user map are looked up individually."""
+    mock_client.users_info.return_value = {"user": {"id": "U02B", "name": "bob"}}
+    mock_client.search_messages.return_value = {
+        "messages": {
+            "matches": [
+                {
+                    "ts": str(make_dt(15).timestamp()),
+                    "channel": {"name": "general"},
+                    "text": "Ping <@U02B>",
+                },
+            ],
+        },
+    }
+
+    events = await collector.collect(make_dt(0), make_dt(60))
+
+    mock_client.users_info.assert_called_once_with(user="U02B")
+    assert "@bob" in events[0].description
+    cache_path = collector._user_cache_path("T123")
+    assert read_cached_users(cache_path) == {"U02B": "bob"}
+
+
+@pytest.mark.parametrize(
+    ("users_info", "expected_users"),
+    [
+        pytest.param(
+            {"return_value": {"user": {"id": "U02B", "name": "bob"}}},
+            {"U01A": "alice", "U02B": "bob"},
+            id="resolved",
+        ),
+        pytest.param(
+            {"side_effect": SlackApiError("not found", {"error": "user_not_found"})},
+            {"U01A": "alice"},
+            id="unresolved",
+        ),
+    ],
+)
+@pytest.mark.asyncio
+async def test_collect_resolving_mentions_keeps_cache_fetch_time(
+    mock_client: MagicMock,
+    collector: SlackCollector,
+    users_info: dict,
+    expected_users: dict[str, str],
+):
+    """Test that looking up a mentioned user does not extend the cache's lifetime."""
+    cache_path = collector._user_cache_path("T123")
+    write_user_cache(cache_path, {"U01A": "alice"}, age_seconds=23 * 60 * 60)
+    fetched_at = json.loads(cache_path.read_text())["fetched_at"]
+    mock_client.users_info.configure_mock(**users_info)
+    mock_client.search_messages.return_value = {
+        "messages": {
+            "matches": [
+                {
+                    "ts": str(make_dt(15).timestamp()),
+                    "channel": {"name": "general"},
+                    "text": "Ping <@U02B>",
+                },
+            ],
+        },
+    }
+
+    await collector.collect(make_dt(0), make_dt(60))
+
+    mock_client.users_list.assert_not_called()
+    cache = json.loads(cache_path.read_text())
+    assert cache["fetched_at"] == fetched_at
+    assert cache["users"] == expected_users
+
 
 @pytest.mark.asyncio
 @patch("recall.collectors.slack.console")
-@patch("recall.collectors.slack.WebClient")
 async def test_collect_search_fails(
-    mock_web_client: MagicMock,
     mock_console: MagicMock,
+    mock_client: MagicMock,
     collector: SlackCollector,
-    monkeypatch: pytest.MonkeyPatch,
 ):
     """Test that a warning is printed if the message search fails."""
-    monkeypatch.setenv("SLACK_USER_TOKEN", "fake-token")
-    mock_client = mock_web_client.return_value
-
     mock_response = MagicMock()
     mock_response.__getitem__.return_value = "search_error"
     mock_client.search_messages.side_effect = SlackApiError(
@@ -185,16 +397,11 @@ async def test_collect_search_fails(
 
 
 @pytest.mark.asyncio
-@patch("recall.collectors.slack.WebClient")
 async def test_collect_successful_with_messages(
-    mock_web_client: MagicMock,
+    mock_client: MagicMock,
     collector: SlackCollector,
-    monkeypatch: pytest.MonkeyPatch,
 ):
     """Test a successful collection run with messages found."""
-    monkeypatch.setenv("SLACK_USER_TOKEN", "fake-token")
-    mock_client = mock_web_client.return_value
-
     mock_client.users_list.return_value = {
         "members": [{"id": "U01A", "name": "alice"}],
     }
@@ -220,19 +427,15 @@ async def test_collect_successful_with_messages(
     assert "@alice" in events[0].description
     assert events[0].url == "https://example.com/message1"
     assert events[0].timestamp == make_dt(15)
+    mock_client.users_info.assert_not_called()
 
 
 @pytest.mark.asyncio
-@patch("recall.collectors.slack.WebClient")
 async def test_collect_skips_messages_outside_time_range(
-    mock_web_client: MagicMock,
+    mock_client: MagicMock,
     collector: SlackCollector,
-    monkeypatch: pytest.MonkeyPatch,
 ):
     """Test that messages outside the specified time range are skipped."""
-    monkeypatch.setenv("SLACK_USER_TOKEN", "fake-token")
-    mock_client = mock_web_client.return_value
-    mock_client.users_list.return_value = {"members": []}
     mock_client.search_messages.return_value = {
         "messages": {
             "matches": [
@@ -249,3 +452,100 @@ async def test_collect_skips_messages_outside_time_range(
     events = await collector.collect(make_dt(0), make_dt(60))
 
     assert len(events) == 0
+
+
+@pytest.mark.asyncio
+async def test_collect_searches_date_range(
+    collector: SlackCollector,
+    mock_client: MagicMock,
+):
+    """Test that the search query covers every day of the time range."""
+    start = make_dt(0)
+    end = start + timedelta(days=2)
+
+    await collector.collect(start, end)
+
+    query = mock_client.search_messages.call_args.kwargs["query"]
+    day_before = (start - timedelta(days=1)).strftime("%Y-%m-%d")
+    day_after = (end + timedelta(days=1)).strftime("%Y-%m-%d")
+    assert query == f"from:me after:{day_before} before:{day_after}"
+
+
+@pytest.mark.asyncio
+async def test_collect_follows_search_pages(
+    collector: SlackCollector,
+    mock_client: MagicMock,
+):
+    """Test that matches are collected from every page of the search results."""
+
+    def match(minute: int) -> dict:
+        return {
+            "ts": str(make_dt(minute).timestamp()),
+            "channel": {"name": "general"},
+            "text": f"Message {minute}",
+            "permalink": f"http://slack.com/{minute}",
+        }
+
+    mock_client.search_messages.side_effect = [
+        {"messages": {"matches": [match(10)], "paging": {"pages": 2}}},
+        {"messages": {"matches": [match(20)], "paging": {"pages": 2}}},
+    ]
+
+    events = await collector.collect(make_dt(0), make_dt(60))
+
+    assert [event.url for event in events] == [
+        "http://slack.com/10",
+        "http://slack.com/20",
+    ]
+    pages = [call.kwargs["page"] for call in mock_client.search_messages.call_args_list]
+    assert pages == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_collect_fetches_users_and_messages_concurrently(
+    collector: SlackCollector,
+    mock_client: MagicMock,
+):
+    """Test that the user list is fetched while the message search is running."""
+    search_started = threading.Event()
+
+    def users_list(**_kwargs: object) -> dict:
+        assert search_started.wait(timeout=5)
+        return {"members": []}
+
+    def search_messages(**_kwargs: object) -> dict:
+        search_started.set()
+        return {"messages": {"matches": []}}
+
+    mock_client.users_list.side_effect = users_list
+    mock_client.search_messages.side_effect = search_messages
+
+    assert await collector.collect(make_dt(0), make_dt(60)) == []
+
+
+@pytest.mark.asyncio
+async def test_search_messages_fetches_pages_concurrently_in_order(
+    collector: SlackCollector,
+    mock_client: MagicMock,
+):
+    """Test that later pages are fetched with bounded concurrency, keeping order."""
+    lock = threading.Lock()
+    active = 0
+    max_active = 0
+
+    def search_messages(page: int, **_kwargs: object) -> dict:
+        nonlocal active, max_active
+        with lock:
+            active += 1
+            max_active = max(max_active, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return {"messages": {"matches": [{"page": page}], "paging": {"pages": 8}}}
+
+    mock_client.search_messages.side_effect = search_messages
+
+    matches = await collector._search_messages(mock_client, "from:me")
+
+    assert [match["page"] for match in matches] == list(range(1, 9))
+    assert 1 < max_active <= SEARCH_PAGE_CONCURRENCY
@@ -0,0 +1,68 @@
+import asyncio
+import threading
+
+import pytest
+
+from recall.utils.concurrency import DaemonThreadExecutor, gather_limited
+
+
+@pytest.mark.asyncio
+async def test_gather_limited_preserves_order():
+    """Test that results come back in the order the awaitables were given."""
+
+    async def delayed(value: int) -> int:
+        await asyncio.sleep(0.01 * (3 - value))
+        return value
+
+    assert await gather_limited(2, *(delayed(i) for i in range(3))) == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_gather_limited_caps_concurrency():
+    """Test that no more than the given number of awaitables run at once."""
+    running = 0
+    peak = 0
+
+    async def track() -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0)
+        running -= 1
+
+    await gather_limited(3, *(track() for _ in range(10)))
+
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_gather_limited_propagates_errors():
+    """Test that an exception from an awaitable is raised to the caller."""
+
+    async def fail() -> None:
+        msg = "boom"
+        raise RuntimeError(msg)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await gather_limited(2, fail())
+
+
+def test_daemon_thread_executor_runs_calls_on_daemon_threads():
+    """Test that calls run on daemon threads and their results are returned."""
+    executor = DaemonThreadExecutor()
+
+    future = executor.submit(lambda: threading.current_thread().daemon)
+
+    assert future.result(timeout=1) is True
+
+
+def test_daemon_thread_executor_propagates_errors():
+    """Test that an exception raised by the call is set on its future."""
+    executor = DaemonThreadExecutor()
+
+    def fail() -> None:
+        msg = "boom"
+        raise RuntimeError(msg)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        executor.submit(fail).result(timeout=1)
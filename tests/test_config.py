@@ -20,22 +20,21 @@ def mock_config_file_content() -> str:
     """)
 
 
-def test_load_config_success(fs: FakeFilesystem, mock_config_file_content: str):
+def test_load_config_success(tmp_path: Path, mock_config_file_content: str):
     """Test that a valid config file is loaded and parsed correctly."""
-    config_path = "/fake/path/config.yaml"
-    fs.create_file(config_path, contents=mock_config_file_content)
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(mock_config_file_content, encoding="utf-8")
 
-    config = load_config(Path(config_path))
+    config = load_config(config_path)
 
     assert "sources" in config
     assert len(config["sources"]) == 1
     assert config["sources"][0]["id"] == "test_source"
 
 
-@pytest.mark.usefixtures("fs")
-def test_load_config_not_found():
+def test_load_config_not_found(tmp_path: Path):
     """Test that ConfigNotFoundError is raised for a non-existent file."""
-    non_existent_path = Path("/non/existent/path/config.yaml")
+    non_existent_path = tmp_path / "non/existent/config.yaml"
 
     with pytest.raises(ConfigNotFoundError):
         load_config(non_existent_path)
@@ -48,14 +47,13 @@ def test_load_config_default_not_found():
         load_config()
 
 
-def test_load_config_yaml_error(fs: FakeFilesystem):
+def test_load_config_yaml_error(tmp_path: Path):
     """Test that ConfigError is raised for a malformed YAML file."""
-    config_path = "/fake/path/malformed.yaml"
-    malformed_content = "sources: [id: 'test',"
-    fs.create_file(config_path, contents=malformed_content)
+    config_path = tmp_path / "malformed.yaml"
+    config_path.write_text("sources: [id: 'test',", encoding="utf-8")
 
     with pytest.raises(ConfigError, match="Error loading or parsing config file"):
-        load_config(Path(config_path))
+        load_config(config_path)
 
 
 def test_load_config_io_permission_error(fs: FakeFilesystem):
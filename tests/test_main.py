@@ -1,4 +1,7 @@
-from datetime import date, datetime, time, timezone, tzinfo
+import asyncio
+import threading
+from collections.abc import Coroutine
+from datetime import date, datetime, time, timedelta, timezone
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -9,6 +12,7 @@ from recall.collectors.base import BaseCollector, Event
 from recall.config import ConfigError, ConfigNotFoundError
 from recall.main import (
     _main,
+    _run_main,
     collect_events,
     get_collector_map,
     init_collectors_from_config,
@@ -145,65 +149,29 @@ def test_parse_flexible_date_invalid(invalid_str: str):
         parse_flexible_date(invalid_str)
 
 
-@patch("recall.main.argparse.ArgumentParser")
-@patch("recall.main.parse_flexible_time")
-@patch("recall.main.parse_flexible_time")
-def test_parse_arguments_with_date(
-    mock_parse_flexible_date: MagicMock,
-    mock_parse_flexible_time: MagicMock,
-    mock_arg_parser: MagicMock,
-):
-    """Test that the default date (today) is used when none is provided."""
-    mock_args = MagicMock(
-        date="2025-10-12",
-        start_time="00:00:00",
-        end_time="23:59:59",
-        config=None,
-    )
-    mock_arg_parser.return_value.parse_args.return_value = mock_args
-
-    mock_date_obj = date(2025, 10, 12)
-    mock_parse_flexible_date.return_value = mock_date_obj
-
-    mock_start_time_obj = time(hour=0, minute=0, second=0)
-    mock_end_time_obj = time(hour=23, minute=59, second=59)
-    mock_parse_flexible_time.side_effect = [mock_start_time_obj, mock_end_time_obj]
-
-    with patch("recall.main.datetime") as mock_datetime:
-        mock_local_tz = MagicMock(spec=tzinfo)
-        mock_datetime.now.return_value.astimezone.return_value.tzinfo = mock_local_tz
-
-        mock_base_datetime = MagicMock(spec=datetime)
-        mock_datetime.return_value = mock_base_datetime
-
-        mock_start_datetime = MagicMock(spec=datetime)
-        mock_end_datetime = MagicMock(spec=datetime)
+@pytest.mark.usefixtures("mock_valid_cli_args")
+@time_machine.travel(datetime(2025, 1, 1, 23, 30, 0, tzinfo=timezone.utc))
+def test_parse_arguments_defaults_to_local_today():
+    """Test that the default date is today in local time, not in UTC."""
+    local_tz = timezone(timedelta(hours=2))
+    with patch("recall.main._LOCAL_TZ", local_tz):
+        start_datetime, end_datetime, _ = parse_arguments()
 
-        mock_base_datetime.replace.side_effect = [
-            mock_start_datetime,
-            mock_end_datetime,
-        ]
+    assert start_datetime == datetime(2025, 1, 2, 0, 0, 0, tzinfo=local_tz)
+    assert end_datetime == datetime(2025, 1, 2, 23, 59, 59, tzinfo=local_tz)
 
-        result = parse_arguments()
 
-        assert result == (mock_start_datetime, mock_end_datetime, None)
+@patch("sys.argv", ["recall", "2025-10-12", "-s", "9", "-e", "17:30"])
+def test_parse_arguments_with_date():
+    """Test that the given date and times are combined in the local time zone."""
+    local_tz = timezone(timedelta(hours=3))
+    with patch("recall.main._LOCAL_TZ", local_tz):
+        start_datetime, end_datetime, config_path = parse_arguments()
 
-        mock_datetime.assert_called_with(
-            year=mock_date_obj.year,
-            month=mock_date_obj.month,
-            day=mock_date_obj.day,
-            tzinfo=mock_local_tz,
-        )
-        mock_base_datetime.replace.assert_any_call(
-            hour=mock_start_time_obj.hour,
-            minute=mock_start_time_obj.minute,
-            second=mock_start_time_obj.second,
-        )
-        mock_base_datetime.replace.assert_any_call(
-            hour=mock_end_time_obj.hour,
-            minute=mock_end_time_obj.minute,
-            second=mock_end_time_obj.second,
-        )
+    assert start_datetime == datetime(2025, 10, 12, 9, 0, 0, tzinfo=local_tz)
+    assert end_datetime == datetime(2025, 10, 12, 17, 30, 0, tzinfo=local_tz)
+    assert start_datetime.tzinfo is local_tz
+    assert config_path is None
 
 
 @pytest.mark.asyncio
@@ -340,20 +308,21 @@ def test_get_collector_map():
     assert issubclass(collector_map["firefox"], BaseCollector)
 
 
-@patch("sys.stdout.isatty", return_value=True)
-def test_is_interactive_true(mock_isatty: MagicMock):
-    """Test that is_interactive returns True when in a TTY."""
-    assert is_interactive() is True
-    mock_isatty.assert_called_once()
-
-
-@patch("sys.stdout.isatty", return_value=False)
-def test_is_interactive_false(mock_isatty: MagicMock):
-    """Test that is_interactive returns False when not in a TTY."""
-    assert is_interactive() is False
+@pytest.mark.parametrize(
+    "isatty",
+    [
+        pytest.param(True, id="tty"),
+        pytest.param(False, id="not_tty"),
+    ],
+)
+def test_is_interactive(isatty: bool):  # noqa: FBT001
+    """Test that is_interactive follows whether stdout is a TTY."""
+    with patch("sys.stdout.isatty", return_value=isatty) as mock_isatty:
+        assert is_interactive() is isatty
     mock_isatty.assert_called_once()
 
 
+@pytest.mark.usefixtures("interactive_true")
 @patch("recall.main.console")
 def test_print_formatted_event_simple(mock_console: MagicMock):
     """Test printing a basic event."""
@@ -364,10 +333,29 @@ def test_print_formatted_event_simple(mock_console: MagicMock):
     )
 
 
-@pytest.mark.usefixtures("interactive_false")
+@pytest.mark.usefixtures("interactive_true")
 @patch("recall.main.console")
-def test_print_formatted_event_with_url_and_duration(
+def test_print_formatted_event_interactive_url_without_markup(
     mock_console: MagicMock,
+):
+    """Test that the URL line is printed as plain text followed by a blank line."""
+    event = Event(
+        timestamp=make_dt(10),
+        source="Test",
+        description="Event with URL",
+        url="https://example.com/[draft]",
+    )
+    print_formatted_event(event, "test_date", timezone.utc)
+    mock_console.print.assert_called_with(
+        "↳ https://example.com/[draft]",
+        markup=False,
+        end="\n\n",
+    )
+
+
+@pytest.mark.usefixtures("interactive_false")
+def test_print_formatted_event_with_url_and_duration(
+    capsys: pytest.CaptureFixture[str],
 ):
     """Test printing an event with a URL and duration."""
     event = Event(
@@ -378,10 +366,27 @@ def test_print_formatted_event_with_url_and_duration(
         duration_minutes=5,
     )
     print_formatted_event(event, "test_date", timezone.utc)
-    mock_console.print.assert_any_call(
-        r"\[test_date 09:15:00] [Test] Event with URL (5 min)",
+    assert capsys.readouterr().out == (
+        "[test_date 09:15:00] [Test] Event with URL (5 min)\n↳ http://example.com\n\n"
     )
-    mock_console.print.assert_any_call("↳ http://example.com")
+
+
+@patch("recall.main.console")
+def test_print_formatted_event_non_interactive_bypasses_rich(
+    mock_console: MagicMock,
+    capsys: pytest.CaptureFixture[str],
+):
+    """Test that non-interactive output is plain text written without Rich."""
+    event = Event(
+        timestamp=make_dt(20),
+        source="Firefox",
+        description="[bold]Not markup[/bold]",
+    )
+    print_formatted_event(event, "test_date", timezone.utc, interactive=False)
+    assert capsys.readouterr().out == (
+        "[test_date 09:20:00] [Firefox] [bold]Not markup[/bold]\n\n"
+    )
+    mock_console.print.assert_not_called()
 
 
 @pytest.mark.usefixtures("interactive_true")
@@ -397,23 +402,17 @@ def test_print_formatted_event_special_case_slack(mock_console: MagicMock):
     assert any("Panel" in str(call) for call in mock_console.print.call_args_list)
 
 
-@patch("recall.main.console")
 @pytest.mark.usefixtures("interactive_false")
-@time_machine.travel("2025-01-01 09:00:00 +0200")
+@patch("recall.main._LOCAL_TZ", timezone(timedelta(hours=2)))
 def test_print_formatted_event_no_tz_fixed(
-    mock_console: MagicMock,
+    capsys: pytest.CaptureFixture[str],
 ):
-    """Test printing an event without a local timezone provided."""
-    local_tz = datetime.now().astimezone().tzinfo
+    """Test that an event is printed in the local time zone when none is given."""
     event = Event(timestamp=make_dt(10), source="Test", description="No TZ test")
 
     print_formatted_event(event, "test_date", None)
 
-    local_timestamp = event.timestamp.astimezone(local_tz)
-    expected_time = local_timestamp.strftime("%H:%M:%S")
-    mock_console.print.assert_any_call(
-        rf"\[test_date {expected_time}] [Test] No TZ test",
-    )
+    assert capsys.readouterr().out == "[test_date 11:10:00] [Test] No TZ test\n\n"
 
 
 @pytest.mark.usefixtures("interactive_true")
@@ -435,6 +434,21 @@ def test_print_formatted_event_split_failure(mock_console: MagicMock):
     mock_console.print.assert_called_with()
 
 
+@pytest.mark.usefixtures("interactive_true")
+@patch("recall.main.console")
+def test_print_formatted_event_empty_body_skips_panel(mock_console: MagicMock):
+    """Test that user content with an empty body is printed without a panel."""
+    description = "Message in #dev:\n\n   \n"
+    event = Event(timestamp=make_dt(25), source="Slack", description=description)
+
+    print_formatted_event(event, "test_date", timezone.utc)
+
+    assert not any("Panel" in str(call) for call in mock_console.print.call_args_list)
+    mock_console.print.assert_any_call(
+        r"\[test_date 09:25:00] [Slack] Message in #dev:",
+    )
+
+
 @pytest.mark.asyncio
 async def test_collect_events_success():
     """Test successful event gathering from multiple collectors."""
@@ -477,6 +491,127 @@ async def test_collect_events_with_error_and_spinner():
     )
 
 
+@pytest.mark.asyncio
+async def test_collect_events_reports_collectors_as_they_finish():
+    """Test that a fast collector is reported before a slower one."""
+
+    async def slow_collect(*_args: object) -> list[Event]:
+        await asyncio.sleep(0.05)
+        return [Event(make_dt(1), "Slow", "Slow event")]
+
+    slow_collector = MagicMock(spec=BaseCollector)
+    slow_collector.name.return_value = "Slow"
+    slow_collector.collect = slow_collect
+
+    fast_collector = MagicMock(spec=BaseCollector)
+    fast_collector.name.return_value = "Fast"
+    fast_collector.collect = AsyncMock(return_value=[])
+
+    mock_spinner = MagicMock()
+    collectors: list[BaseCollector] = [slow_collector, fast_collector]
+    events = await collect_events(
+        collectors,
+        make_dt(0),
+        make_dt(60),
+        spinner=mock_spinner,
+    )
+
+    assert [event.source for event in events] == ["Slow"]
+    assert [call.args[0] for call in mock_spinner.write.call_args_list] == [
+        "    - ✅ Fast collector found 0 events.",
+        "    - ✅ Slow collector found 1 events.",
+    ]
+
+
+@pytest.mark.asyncio
+@patch("recall.main.COLLECTOR_TIMEOUT_SECONDS", 0.01)
+async def test_collect_events_times_out_hung_collector():
+    """Test that a collector that does not finish in time is reported as an error."""
+
+    async def hung_collect(*_args: object) -> list[Event]:
+        await asyncio.sleep(10)
+        return []
+
+    hung_collector = MagicMock(spec=BaseCollector)
+    hung_collector.name.return_value = "Hung"
+    hung_collector.collect = hung_collect
+
+    mock_spinner = MagicMock()
+    events = await collect_events(
+        [hung_collector],
+        make_dt(0),
+        make_dt(60),
+        spinner=mock_spinner,
+    )
+
+    assert events == []
+    mock_spinner.write.assert_called_once_with(
+        "    - ❌ Error in Hung collector: timed out after 0.01 seconds",
+    )
+
+
+@pytest.mark.asyncio
+@patch("recall.main.COLLECTOR_TIMEOUT_SECONDS", 0.01)
+async def test_collect_events_does_not_time_out_prepare():
+    """Test that only collect(), not prepare(), is subject to the timeout."""
+
+    async def slow_prepare() -> None:
+        await asyncio.sleep(0.05)
+
+    collector = MagicMock(spec=BaseCollector)
+    collector.name.return_value = "Interactive"
+    collector.prepare = slow_prepare
+    collector.collect = AsyncMock(return_value=[Event(make_dt(1), "I", "Event")])
+
+    mock_spinner = MagicMock()
+    events = await collect_events([collector], make_dt(0), make_dt(60), mock_spinner)
+
+    assert len(events) == 1
+    mock_spinner.write.assert_called_once_with(
+        "    - ✅ Interactive collector found 1 events.",
+    )
+
+
+@patch("recall.main.COLLECTOR_TIMEOUT_SECONDS", 0.01)
+def test_run_main_abandons_blocked_worker_thread():
+    """Test that a collector stuck in a blocking call does not hold up exit.
+
+    asyncio.run joins the default executor's threads before returning, so the
+    blocked call must run on a daemon thread that is left behind instead.
+    """
+    release = threading.Event()
+    worker_threads = []
+    mock_spinner = MagicMock()
+
+    def block() -> list[Event]:
+        worker_threads.append(threading.current_thread())
+        release.wait(timeout=5)
+        return []
+
+    async def blocked_collect(*_args: object) -> list[Event]:
+        return await asyncio.to_thread(block)
+
+    blocked_collector = MagicMock(spec=BaseCollector)
+    blocked_collector.name.return_value = "Blocked"
+    blocked_collector.prepare = AsyncMock()
+    blocked_collector.collect = blocked_collect
+
+    async def collect_blocked() -> None:
+        await collect_events([blocked_collector], make_dt(0), make_dt(60), mock_spinner)
+
+    try:
+        with patch("recall.main.main", collect_blocked):
+            asyncio.run(_run_main())
+
+        mock_spinner.write.assert_called_once_with(
+            "    - ❌ Error in Blocked collector: timed out after 0.01 seconds",
+        )
+        assert worker_threads[0].is_alive()
+        assert worker_threads[0].daemon
+    finally:
+        release.set()
+
+
 @pytest.mark.asyncio
 @pytest.mark.usefixtures("interactive_true", "mock_valid_cli_args")
 async def test_main_non_interactive_mode(
@@ -550,6 +685,11 @@ def test_main_entrypoint_suppresses_keyboard_interrupt(mock_asyncio_run: MagicMo
 
     The test passes if no KeyboardInterrupt is propagated outside of _main().
     """
-    mock_asyncio_run.side_effect = KeyboardInterrupt
+
+    def interrupt(coro: Coroutine) -> None:
+        coro.close()
+        raise KeyboardInterrupt
+
+    mock_asyncio_run.side_effect = interrupt
     _main()
     mock_asyncio_run.assert_called_once()
@@ -1,86 +1,68 @@
+from dataclasses import replace
 from datetime import timedelta
 
+import pytest
+
 from recall.collectors.base import Event
 from recall.utils.summarizer import (
     MAX_GAP_MINUTES,
     _create_summarized_event,
-    _group_events,
-    _is_same_activity,
     summarize_events,
 )
 
 from .utils import make_dt
 
 
-def test_is_same_activity_identical_within_gap(event: Event):
-    """Test two identical events slightly separated are considered the same activity."""
-    next_event = Event(
-        timestamp=make_dt(10) + timedelta(minutes=MAX_GAP_MINUTES - 1),
-        source=event.source,
-        description=event.description,
-        url=event.url,
-    )
-    assert _is_same_activity(event, next_event) is True
-
-
-def test_is_same_activity_time_gap_exceeded(event: Event):
-    """Test two identical events outside the MAX_GAP_MINUTES are NOT the same."""
-    next_event = Event(
-        timestamp=make_dt(10) + timedelta(minutes=MAX_GAP_MINUTES + 1),
-        source=event.source,
-        description=event.description,
-        url=event.url,
-    )
-    assert _is_same_activity(event, next_event) is False
-
-
-def test_is_same_activity_different_description(event: Event):
-    """Test different descriptions stop grouping."""
-    next_event = Event(
-        timestamp=make_dt(11),
-        source=event.source,
-        description="git push",
-        url=event.url,
-    )
-    assert _is_same_activity(event, next_event) is False
-
-
-def test_is_same_activity_different_source(event: Event):
-    """Test different sources stop grouping."""
-    next_event = Event(
-        timestamp=make_dt(11),
-        source="GitLab",
-        description=event.description,
-        url=event.url,
-    )
-    assert _is_same_activity(event, next_event) is False
-
-
-def test_is_same_activity_different_url(event: Event):
-    """Test different URLs stop grouping."""
-    next_event = Event(
-        timestamp=make_dt(11),
-        source=event.source,
-        description=event.description,
-        url="https://different.com",
-    )
-    assert _is_same_activity(event, next_event) is False
+@pytest.mark.parametrize(
+    ("changes", "expected_count"),
+    [
+        pytest.param(
+            {"timestamp": make_dt(10) + timedelta(minutes=MAX_GAP_MINUTES - 1)},
+            1,
+            id="identical_within_gap",
+        ),
+        pytest.param(
+            {"timestamp": make_dt(10) + timedelta(minutes=MAX_GAP_MINUTES + 1)},
+            2,
+            id="time_gap_exceeded",
+        ),
+        pytest.param(
+            {"timestamp": make_dt(11), "description": "git push"},
+            2,
+            id="different_description",
+        ),
+        pytest.param(
+            {"timestamp": make_dt(11), "source": "GitLab"},
+            2,
+            id="different_source",
+        ),
+        pytest.param(
+            {"timestamp": make_dt(11), "url": "https://different.com"},
+            2,
+            id="different_url",
+        ),
+    ],
+)
+def test_summarize_events_merges_only_same_activity(
+    event: Event,
+    changes: dict,
+    expected_count: int,
+):
+    """Test that a following event is merged only if it continues the activity."""
+    next_event = replace(event, **changes)
+    assert len(summarize_events([event, next_event])) == expected_count
 
 
 def test_create_summarized_event_min_duration():
     """Test that the minimum duration is 1 minute for a single event."""
-    start_ts = make_dt(10, 0)
-    end_ts = make_dt(10, 30)
-    events = [
-        Event(timestamp=start_ts, source="S", description="D"),
-        Event(timestamp=end_ts, source="S", description="D"),
-    ]
-    summary = _create_summarized_event(events)
+    start_event = Event(timestamp=make_dt(10, 0), source="S", description="D")
+    last_event = Event(timestamp=make_dt(10, 30), source="S", description="D")
+    summary = _create_summarized_event(start_event, last_event)
     assert summary.duration_minutes == 1
 
 
-def test_group_events_yields_correct_groups():
-    """Test that _group_events correctly chunks a complex sequence into groups."""
+def test_summarize_events_yields_correct_groups():
+    """Test that a complex sequence is split into the right activities."""
     events = [
         Event(timestamp=make_dt(10), source="S", description="A", url=None),
         Event(timestamp=make_dt(11), source="S", description="A", url=None),
@@ -97,17 +79,23 @@ def test_group_events_yields_correct_groups():
             url=None,
         ),
     ]
-    groups = list(_group_events(events))
-    assert len(groups) == 3
-    assert len(groups[0]) == 2
-    assert len(groups[1]) == 1
-    assert len(groups[2]) == 1
+    result = summarize_events(events)
+    assert [(e.description, e.timestamp) for e in result] == [
+        ("A", make_dt(10)),
+        ("B", make_dt(18)),
+        ("A", make_dt(25)),
+    ]
 
 
-def test_group_events_empty_list():
-    """Test that _group_events correctly handles an empty list."""
-    groups = list(_group_events([]))
-    assert groups == []
+def test_summarize_events_gap_measured_from_last_event():
+    """Test that an activity continues as long as each gap stays short."""
+    events = [
+        Event(timestamp=make_dt(minute), source="S", description="D")
+        for minute in range(10, 30, MAX_GAP_MINUTES - 1)
+    ]
+    result = summarize_events(events)
+    assert len(result) == 1
+    assert result[0].duration_minutes == 4 * (MAX_GAP_MINUTES - 1)
 
 
 def test_summarize_events_empty():
@@ -125,4 +113,15 @@ def test_summarize_events_full_pipeline_duration():
     result = summarize_events(events)
     assert len(result) == 2
     assert result[0].duration_minutes == 2
-    assert result[1].duration_minutes == 1
+    assert result[1] is events[2]
+
+
+def test_summarize_events_returns_unmergeable_events_unchanged():
+    """Test that events with no identical neighbour are passed through as is."""
+    events = [
+        Event(timestamp=make_dt(10), source="F", description="A", url="https://a"),
+        Event(timestamp=make_dt(11), source="F", description="B", url="https://b"),
+    ]
+    result = summarize_events(events)
+    assert result == events
+    assert result is not events